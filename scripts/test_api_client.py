@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+API Client Testing Script
+Tests response handling of the OpenRouter client without network access
+"""
+
+import io
+import sys
+import os
+
+import requests
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from api.secure_client import SecureAPIClient
+
+
+def _sse_response(body: bytes) -> requests.Response:
+    """Build a streamed text/event-stream response (no charset) from raw bytes"""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/event-stream"
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def test_chat_completion_stream():
+    """Test streamed completion decoding"""
+    print("\n🌊 Testing Chat Completion Stream...")
+
+    client = SecureAPIClient(api_key="test-key")
+
+    # Test 1: Non-ASCII deltas
+    print("  Test 1: Non-ASCII deltas")
+    body = (
+        ": keep-alive\n\n"
+        'data: {"choices": [{"delta": {"content": "café "}}]}\n\n'
+        'data: {"choices": [{"delta": {"content": "🚀"}}]}\n\n'
+        "data: [DONE]\n\n"
+    ).encode("utf-8")
+    client._send = lambda *args, **kwargs: _sse_response(body)
+
+    text = "".join(client.chat_completion_stream([{"role": "user", "content": "hi"}]))
+    client.close()
+
+    if text == "café 🚀":
+        print("  ✅ UTF-8 deltas decoded correctly")
+    else:
+        print(f"  ❌ Expected 'café 🚀', got {text!r}")
+        return False
+
+    print("✅ Chat Completion Stream: All tests passed\n")
+    return True
+
+
+def main():
+    """Run all API client tests"""
+    print("=" * 50)
+    print("🔌 API CLIENT TEST SUITE")
+    print("=" * 50)
+
+    tests = [
+        ("Chat Completion Stream", test_chat_completion_stream),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+                print(f"❌ {name} FAILED\n")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {name} CRASHED: {str(e)}\n")
+
+    print("=" * 50)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 50)
+
+    if failed == 0:
+        print("✅ All API client tests passed!")
+        return 0
+    else:
+        print("❌ Some tests failed. Please fix issues before deploying.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+Shared HTTP connection pool for LiteLLM
+Routes every CrewAI agent's OpenAI-compatible calls through one pooled client
+"""
+
+import atexit
+import functools
+import importlib.util
+
+import httpx
+
+# Connection pool shared by every LiteLLM OpenAI-compatible request. Idle
+# connections are kept for 2 minutes (httpx defaults to 5 seconds) so a
+# crew started after the user picks a strategy doesn't pay a new TLS handshake
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=120)
+
+
+@functools.cache
+def install_shared_http_client() -> httpx.Client:
+    """
+    Route LiteLLM's OpenAI-compatible calls through one pooled httpx client
+
+    LiteLLM otherwise builds a fresh httpx.Client for each OpenAI client it
+    creates (and again whenever its client cache expires), so agent turns
+    can pay for new TCP/TLS handshakes. HTTP/2 is used when h2 is installed.
+
+    Returns:
+        The shared httpx.Client
+    """
+    import litellm
+
+    client = httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=HTTP_LIMITS,
+        timeout=60,
+        follow_redirects=True
+    )
+    litellm.client_session = client
+    atexit.register(client.close)
+    return client
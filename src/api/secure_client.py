@@ -2,10 +2,16 @@
 Secure API client for OpenRouter with retry logic and error handling
 """
 
+import atexit
+import functools
+import orjson
+import random
 import requests
-import time
-from typing import Optional, Dict, Any
-import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Iterator
 from config.secure_config import config
 
 
@@ -24,6 +30,51 @@ class AuthenticationError(APIError):
     pass
 
 
+class JitteredRetry(Retry):
+    """Retry policy using decorrelated jitter instead of fixed exponential backoff"""
+
+    BACKOFF_CAP = 30.0
+    RETRY_AFTER_CAP = 60.0
+
+    def __init__(self, *args, prev_backoff: float = 0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prev_backoff = prev_backoff
+
+    def new(self, **kwargs) -> "JitteredRetry":
+        retry = super().new(**kwargs)
+        retry.prev_backoff = self.prev_backoff
+        return retry
+
+    def get_backoff_time(self) -> float:
+        """
+        Compute next sleep as uniform(base, min(cap, prev * 3))
+
+        Spreads retries from concurrent sessions so they don't hit the
+        server's rate-limit window in lockstep.
+        """
+        base = self.backoff_factor
+        prev = self.prev_backoff or base
+        wait = random.uniform(base, min(self.BACKOFF_CAP, prev * 3))
+        self.prev_backoff = wait
+        return wait
+
+    def get_retry_after(self, response) -> Optional[float]:
+        """
+        Read the server's Retry-After (seconds or HTTP-date), capped at 60s
+
+        Malformed headers return None so the jittered backoff is used instead.
+        """
+        try:
+            retry_after = super().get_retry_after(response)
+        except InvalidHeader:
+            return None
+
+        if retry_after is None:
+            return None
+
+        return min(retry_after, self.RETRY_AFTER_CAP)
+
+
 class SecureAPIClient:
     """Secure API client with retry logic and error handling"""
 
@@ -49,6 +100,35 @@ class SecureAPIClient:
             "X-Title": "AI Content Marketing Strategist"
         }
 
+        # Reuse TCP/TLS connections across retries and completions;
+        # urllib3 drives backoff and honors Retry-After on 429/503.
+        # Read timeouts are not retried: the server may still be generating
+        # (and billing) the completion, so resending would pay for it again
+        retry = JitteredRetry(
+            total=self.retry_config['max_retries'],
+            read=0,
+            backoff_factor=self.retry_config['backoff_factor'],
+            status_forcelist=set(self.retry_config['retry_on_status']) | {429},
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self.session.mount("https://", adapter)
+
+        self.completions_url = f"{self.base_url}/chat/completions"
+        self._payload_template = {
+            "model": self.model_config['model'],
+            "temperature": self.model_config['temperature'],
+            "max_tokens": self.model_config['max_tokens']
+        }
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections"""
+        self.session.close()
+
     def chat_completion(
         self,
         messages: list[Dict[str, str]],
@@ -73,16 +153,107 @@ class SecureAPIClient:
             RateLimitError: If rate limited
             AuthenticationError: If authentication fails
         """
-        url = f"{self.base_url}/chat/completions"
+        payload = self._build_payload(messages, model, temperature, max_tokens)
 
-        payload = {
-            "model": model or self.model_config['model'],
-            "messages": messages,
-            "temperature": temperature or self.model_config['temperature'],
-            "max_tokens": max_tokens or self.model_config['max_tokens']
-        }
+        return self._make_request_with_retry("POST", self.completions_url, data=orjson.dumps(payload))
+
+    def chat_completion_stream(
+        self,
+        messages: list[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion, yielding content deltas as they arrive
+
+        Suitable for st.write_stream so the UI renders the first tokens
+        without waiting for the full completion.
+
+        Args:
+            messages: List of message dictionaries
+            model: Optional model override
+            temperature: Optional temperature override
+            max_tokens: Optional max_tokens override
+
+        Yields:
+            Content text fragments
+
+        Raises:
+            APIError: If request fails after retries
+            RateLimitError: If rate limited
+            AuthenticationError: If authentication fails
+        """
+        payload = self._build_payload(messages, model, temperature, max_tokens)
+        payload["stream"] = True
+
+        response = self._send("POST", self.completions_url, data=orjson.dumps(payload), stream=True)
+
+        with response:
+            # Iterate raw bytes: text/event-stream responses usually carry no
+            # charset, so requests would decode them as ISO-8859-1; orjson
+            # decodes the UTF-8 payload itself
+            for line in response.iter_lines():
+                # SSE frames look like "data: {...}"; skip keep-alive comments
+                if not line or not line.startswith(b"data: "):
+                    continue
 
-        return self._make_request_with_retry("POST", url, json=payload)
+                data = line[6:]
+                if data == b"[DONE]":
+                    break
+
+                chunk = orjson.loads(data)
+                for choice in chunk.get("choices", []):
+                    content = choice.get("delta", {}).get("content")
+                    if content:
+                        yield content
+
+    def _build_payload(
+        self,
+        messages: list[Dict[str, str]],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
+        """Build a completion payload from the cached template and overrides"""
+        payload = self._payload_template.copy()
+        payload["messages"] = messages
+        if model:
+            payload["model"] = model
+        if temperature is not None:
+            payload["temperature"] = temperature
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+
+        return payload
+
+    def chat_completions(
+        self,
+        conversations: list[list[Dict[str, str]]],
+        **kwargs
+    ) -> list[Dict[str, Any]]:
+        """
+        Make several independent chat completion requests concurrently
+
+        Args:
+            conversations: List of message lists, one per completion
+            **kwargs: Overrides forwarded to chat_completion
+
+        Returns:
+            API response dictionaries in the same order as conversations
+
+        Raises:
+            APIError: If any request fails after retries
+        """
+        if not conversations:
+            return []
+
+        # Requests share the session's connection pool (pool_maxsize=16)
+        with ThreadPoolExecutor(max_workers=min(len(conversations), 16)) as executor:
+            return list(executor.map(
+                lambda messages: self.chat_completion(messages, **kwargs),
+                conversations
+            ))
 
     def _make_request_with_retry(
         self,
@@ -91,7 +262,7 @@ class SecureAPIClient:
         **kwargs
     ) -> Dict[str, Any]:
         """
-        Make HTTP request with exponential backoff retry logic
+        Make HTTP request; retries and backoff are handled by the session adapter
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -101,77 +272,62 @@ class SecureAPIClient:
         Returns:
             Response JSON
 
+        Raises:
+            APIError: If request fails after retries
+        """
+        return orjson.loads(self._send(method, url, **kwargs).content)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send a request and map error statuses to API exceptions
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            **kwargs: Additional request parameters
+
+        Returns:
+            Successful response
+
         Raises:
             APIError: If request fails after retries
         """
         max_retries = self.retry_config['max_retries']
-        backoff_factor = self.retry_config['backoff_factor']
         retry_statuses = self.retry_config['retry_on_status']
 
-        last_error = None
-
-        for attempt in range(max_retries + 1):
-            try:
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    timeout=self.model_config['timeout'],
-                    **kwargs
-                )
-
-                # Check for specific error status codes
-                if response.status_code == 401:
-                    raise AuthenticationError("Invalid API key")
-
-                if response.status_code == 429:
-                    if attempt < max_retries:
-                        # Rate limited, retry with backoff
-                        wait_time = backoff_factor ** attempt
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise RateLimitError("Rate limit exceeded. Please try again later.")
-
-                if response.status_code in retry_statuses:
-                    if attempt < max_retries:
-                        # Server error, retry with backoff
-                        wait_time = backoff_factor ** attempt
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise APIError(f"Server error: {response.status_code}")
-
-                # Raise for other error status codes
-                response.raise_for_status()
-
-                # Success
-                return response.json()
-
-            except requests.exceptions.Timeout as e:
-                last_error = e
-                if attempt < max_retries:
-                    wait_time = backoff_factor ** attempt
-                    time.sleep(wait_time)
-                    continue
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                timeout=self.model_config['timeout'],
+                **kwargs
+            )
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Request failed after {max_retries} retries: {str(e)}")
 
-            except requests.exceptions.RequestException as e:
-                last_error = e
-                if attempt < max_retries:
-                    wait_time = backoff_factor ** attempt
-                    time.sleep(wait_time)
-                    continue
+        # Check for specific error status codes
+        if response.status_code == 401:
+            raise AuthenticationError("Invalid API key")
 
-            except AuthenticationError:
-                # Don't retry authentication errors
-                raise
+        if response.status_code == 429:
+            raise RateLimitError("Rate limit exceeded. Please try again later.")
 
-            except RateLimitError:
-                # Don't retry if we've exhausted retries
-                raise
+        if response.status_code in retry_statuses:
+            raise APIError(f"Server error: {response.status_code}")
+
+        try:
+            # Raise for other error status codes
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            raise APIError(f"Request failed: {str(e)}")
 
-        # If we get here, all retries failed
-        raise APIError(f"Request failed after {max_retries} retries: {str(last_error)}")
+        # Success
+        return response
 
     def validate_connection(self) -> tuple[bool, Optional[str]]:
         """
@@ -219,9 +375,11 @@ def test_api_connection() -> None:
 
     Displays success or error messages in the UI
     """
+    import streamlit as st
+
     try:
         with st.spinner("Testing API connection..."):
-            client = SecureAPIClient()
+            client = get_client()
             is_valid, error = client.validate_connection()
 
             if is_valid:
@@ -237,18 +395,25 @@ def test_api_connection() -> None:
         st.error(f"❌ Unexpected Error: {str(e)}")
 
 
+@functools.lru_cache(maxsize=1)
+def _singleton_client() -> SecureAPIClient:
+    """Create the process-wide API client on first use"""
+    client = SecureAPIClient()
+    atexit.register(client.close)
+    return client
+
+
 def get_client() -> SecureAPIClient:
     """
     Get or create API client instance
 
+    The client is shared across all Streamlit sessions so they reuse a
+    single connection pool.
+
     Returns:
         SecureAPIClient instance
 
     Raises:
         AuthenticationError: If API key not configured
     """
-    # Cache client in session state
-    if 'api_client' not in st.session_state:
-        st.session_state.api_client = SecureAPIClient()
-
-    return st.session_state.api_client
+    return _singleton_client()
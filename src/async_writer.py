@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Background artifact writer
+Queues text artifacts and writes them on a worker thread so the workflow
+doesn't block on disk I/O
+"""
+
+import queue
+import threading
+from typing import Iterable, List, Optional, Tuple, Union
+
+
+class AsyncArtifactWriter:
+    """Writes submitted text artifacts to disk on a single background thread"""
+
+    _STOP = object()
+
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue()
+        self.errors: List[Tuple[str, Exception]] = []
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: str, content: Union[str, Iterable[str]]) -> None:
+        """
+        Queue content to be written to path
+
+        Args:
+            path: Destination file path
+            content: Text content, or a sequence of text parts written back to
+                back without joining them first (written as UTF-8)
+        """
+        self._queue.put((path, content))
+
+    def flush_and_join(self, timeout: Optional[float] = None) -> List[Tuple[str, Exception]]:
+        """
+        Write everything still queued and stop the worker thread
+
+        Args:
+            timeout: Optional seconds to wait for the worker
+
+        Returns:
+            List of (path, error) for writes that failed
+        """
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        return self.errors
+
+    def _run(self) -> None:
+        """Worker loop: write queued artifacts until the stop sentinel arrives"""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+
+            path, content = item
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    if isinstance(content, str):
+                        f.write(content)
+                    else:
+                        f.writelines(content)
+            except Exception as e:
+                self.errors.append((path, e))
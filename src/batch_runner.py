@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Non-interactive batch runner
+Generates strategy packages for many brands at once (e.g. an agency
+pipeline) by sending one flattened prompt per brand concurrently
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import orjson
+
+from async_writer import AsyncArtifactWriter
+from cli_input import BrandInputCollector
+
+# Concurrent requests; matches the API client's connection pool size
+MAX_PARALLEL = 16
+
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Brand analysis, 5 strategies, recommendation and calendar in one request
+BATCH_PROMPT = """Analyze the following brand information:
+
+{brand_data_text}
+
+Then produce, in this order:
+
+# PART 1: BRAND ANALYSIS
+Brand positioning, primary audience, key differentiators, content opportunities,
+channel considerations, constraints & resources, strategic imperatives and
+competitive gaps.
+
+# PART 2: STRATEGY OPTIONS (5 Strategies)
+Five distinct strategies (Thought Leadership, Community Building, Educational Hub,
+Product-Led Growth, Customer Stories). For each: name, tagline, core approach,
+content pillars, posting frequency, content mix, top 3 content ideas, effort,
+30-day results, pros and cons.
+
+## RECOMMENDATION
+The best strategy for this brand, why, and a Week 1 action plan.
+
+# PART 3: CONTENT CALENDAR ({strategy_month})
+20-25 content pieces for the recommended strategy. For each: week, date, title,
+pillar, channel, format, one-sentence message, CTA and effort (L/M/H). Finish with
+an executive summary, weekly breakdown and 3 quick wins."""
+
+
+def load_brand_inputs(path: str) -> List[Dict[str, Any]]:
+    """
+    Read brand inputs from a JSONL file (one brand dict per line)
+
+    Args:
+        path: Path to the JSONL file
+
+    Returns:
+        List of brand data dicts
+    """
+    with open(path, "rb") as f:
+        return [orjson.loads(line) for line in f if line.strip()]
+
+
+def build_prompt(brand: Dict[str, Any]) -> str:
+    """Flatten the brand analysis -> strategies -> calendar chain into one prompt"""
+    collector = BrandInputCollector()
+    collector.data = brand
+
+    return BATCH_PROMPT.format(
+        brand_data_text=collector.format_for_workflow().strip(),
+        strategy_month=brand['strategy_month']
+    )
+
+
+def brand_slug(brand: Dict[str, Any], index: int) -> str:
+    """
+    Directory-safe name for a brand's outputs
+
+    The input index is prefixed so brands whose names slug the same (e.g.
+    "Acme Inc" and "ACME, Inc.") don't overwrite each other's package.
+    """
+    slug = _SLUG_RE.sub('-', brand['brand_name'].lower()).strip('-') or "brand"
+    return f"{index:03d}-{slug}"
+
+
+def run_batch(brand_inputs: List[Dict[str, Any]], out_dir: str = "outputs") -> List[Tuple[str, Exception]]:
+    """
+    Generate a strategy package for every brand and write it under out_dir
+
+    Each brand's package is written to <out_dir>/<index>-<brand-slug>/strategy_package.md
+    as soon as its response has finished streaming. The package is a single
+    long completion, so it is streamed: the client's read timeout then bounds
+    the gap between chunks rather than the whole generation.
+
+    Args:
+        brand_inputs: Brand data dicts (same keys as the CLI collects)
+        out_dir: Output directory root
+
+    Returns:
+        List of (brand name, error) for brands that failed
+    """
+    from api.secure_client import get_client
+
+    if not brand_inputs:
+        return []
+
+    client = get_client()
+    writer = AsyncArtifactWriter()
+    failures: List[Tuple[str, Exception]] = []
+
+    def generate(index: int, brand: Dict[str, Any]) -> None:
+        try:
+            content = "".join(client.chat_completion_stream(
+                [{"role": "user", "content": build_prompt(brand)}]
+            ))
+        except Exception as e:
+            failures.append((brand.get('brand_name', '?'), e))
+            return
+
+        brand_dir = os.path.join(out_dir, brand_slug(brand, index))
+        os.makedirs(brand_dir, exist_ok=True)
+        writer.submit(os.path.join(brand_dir, "strategy_package.md"), content)
+        print(f"   ✅ {brand['brand_name']}")
+
+    with ThreadPoolExecutor(max_workers=min(len(brand_inputs), MAX_PARALLEL)) as executor:
+        list(executor.map(generate, range(1, len(brand_inputs) + 1), brand_inputs))
+
+    for path, error in writer.flush_and_join():
+        failures.append((path, error))
+
+    return failures
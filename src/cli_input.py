@@ -2,6 +2,80 @@
 import sys
 from datetime import datetime
 
+# Banner separators
+_SEP = "=" * 70
+_SEP_NL = _SEP + "\n"
+_NL_SEP = "\n" + _SEP
+_NL_SEP_NL = "\n" + _SEP_NL
+
+# Menu options shared across sessions
+INDUSTRIES = (
+    "B2B SaaS", "E-commerce - Fashion", "E-commerce - Electronics",
+    "Local Services", "Healthcare", "Education", "Finance",
+    "Real Estate", "Food & Beverage", "Travel & Hospitality",
+    "Marketing Agency", "Consulting", "Manufacturing",
+    "Non-Profit", "Entertainment", "Technology Hardware",
+    "Professional Services", "Home Services", "Automotive",
+    "Beauty & Wellness", "Sports & Fitness", "Media & Publishing",
+    "Other"
+)
+
+BUSINESS_GOALS = (
+    "Brand Awareness",
+    "Lead Generation",
+    "Sales",
+    "Product Education",
+    "Community Building",
+    "Customer Retention",
+    "Thought Leadership"
+)
+
+CHANNELS = (
+    "LinkedIn", "Twitter", "Instagram", "Facebook",
+    "TikTok", "Blog", "YouTube", "Pinterest",
+    "Email Newsletter", "Podcast", "Medium"
+)
+
+TONES = (
+    "Professional & Corporate",
+    "Professional yet Approachable",
+    "Casual & Friendly",
+    "Playful & Fun",
+    "Authoritative & Expert",
+    "Inspirational & Aspirational"
+)
+
+BUDGETS = (
+    "Under $500",
+    "$500 - $1,000",
+    "$1,000 - $2,500",
+    "$2,500 - $5,000",
+    "$5,000 - $10,000",
+    "$10,000+"
+)
+
+TIME_COMMITMENTS = (
+    "5-10 hours/week",
+    "10-20 hours/week",
+    "20-30 hours/week",
+    "30+ hours/week"
+)
+
+RESOURCES = (
+    "In-house writer",
+    "In-house designer",
+    "In-house video editor",
+    "Freelancers",
+    "AI tools (ChatGPT, etc.)",
+    "No dedicated resources"
+)
+
+STRATEGY_MONTHS = (
+    "January 2025", "February 2025", "March 2025",
+    "April 2025", "May 2025", "June 2025"
+)
+
+
 class BrandInputCollector:
     """Interactive CLI for collecting brand information"""
 
@@ -10,13 +84,16 @@ class BrandInputCollector:
 
     def print_header(self):
         """Print welcome header"""
-        print("\n" + "="*70)
-        print("🎯 AI CONTENT MARKETING STRATEGIST")
-        print("="*70)
-        print("\nWelcome! I'll ask you some questions about your brand to create")
-        print("a personalized content marketing strategy.\n")
-        print("This will take about 5 minutes to complete.")
-        print("="*70 + "\n")
+        sys.stdout.write(
+            f"{_NL_SEP}\n"
+            "🎯 AI CONTENT MARKETING STRATEGIST\n"
+            f"{_SEP}\n"
+            "\nWelcome! I'll ask you some questions about your brand to create\n"
+            "a personalized content marketing strategy.\n\n"
+            "This will take about 5 minutes to complete.\n"
+            f"{_SEP_NL}\n"
+        )
+        sys.stdout.flush()
 
     def get_input(self, prompt, required=True, default=None):
         """Get input from user with validation"""
@@ -36,25 +113,25 @@ class BrandInputCollector:
 
     def get_multiline_input(self, prompt, required=True):
         """Get multiline input from user"""
-        print(f"\n{prompt}")
-        print("(Press Enter twice when done, or Ctrl+D)\n")
-        lines = []
-        try:
-            while True:
-                line = input()
-                if line == "" and lines:  # Empty line after content
-                    break
-                lines.append(line)
-        except EOFError:
-            pass
-
-        result = "\n".join(lines).strip()
-
-        if required and not result:
-            print("❌ This field is required.\n")
-            return self.get_multiline_input(prompt, required)
+        while True:
+            print(f"\n{prompt}")
+            print("(Press Enter twice when done, or Ctrl+D)\n")
+            lines = []
+            try:
+                while True:
+                    line = input()
+                    if line == "" and lines:  # Empty line after content
+                        break
+                    lines.append(line)
+            except EOFError:
+                pass
+
+            result = "\n".join(lines).strip()
 
-        return result
+            if result or not required:
+                return result
+
+            print("❌ This field is required.\n")
 
     def get_choice(self, prompt, options, allow_multiple=False):
         """Get choice from predefined options"""
@@ -62,28 +139,26 @@ class BrandInputCollector:
         for i, option in enumerate(options, 1):
             print(f"  {i}. {option}")
 
-        if allow_multiple:
-            print("\nEnter numbers separated by commas (e.g., 1,3,5)")
-            choices = input("Your selection: ").strip()
-            try:
-                indices = [int(x.strip()) - 1 for x in choices.split(",")]
-                selected = [options[i] for i in indices if 0 <= i < len(options)]
-                if selected:
-                    return selected
-            except:
-                pass
-            print("❌ Invalid selection. Please try again.")
-            return self.get_choice(prompt, options, allow_multiple)
-        else:
-            choice = input("Your selection (number): ").strip()
-            try:
-                index = int(choice) - 1
-                if 0 <= index < len(options):
-                    return options[index]
-            except:
-                pass
+        while True:
+            if allow_multiple:
+                print("\nEnter numbers separated by commas (e.g., 1,3,5)")
+                choices = input("Your selection: ").strip()
+                try:
+                    indices = [int(x.strip()) - 1 for x in choices.split(",")]
+                    selected = [options[i] for i in indices if 0 <= i < len(options)]
+                    if selected:
+                        return selected
+                except:
+                    pass
+            else:
+                choice = input("Your selection (number): ").strip()
+                try:
+                    index = int(choice) - 1
+                    if 0 <= index < len(options):
+                        return options[index]
+                except:
+                    pass
             print("❌ Invalid selection. Please try again.")
-            return self.get_choice(prompt, options, allow_multiple)
 
     def collect_all(self):
         """Collect all brand information"""
@@ -94,22 +169,12 @@ class BrandInputCollector:
 
         self.data['brand_name'] = self.get_input("Brand Name", required=True)
 
-        industries = [
-            "B2B SaaS", "E-commerce - Fashion", "E-commerce - Electronics",
-            "Local Services", "Healthcare", "Education", "Finance",
-            "Real Estate", "Food & Beverage", "Travel & Hospitality",
-            "Marketing Agency", "Consulting", "Manufacturing",
-            "Non-Profit", "Entertainment", "Technology Hardware",
-            "Professional Services", "Home Services", "Automotive",
-            "Beauty & Wellness", "Sports & Fitness", "Media & Publishing",
-            "Other"
-        ]
-        self.data['industry'] = self.get_choice("Select your industry:", industries)
+        self.data['industry'] = self.get_choice("Select your industry:", INDUSTRIES)
 
         self.data['website'] = self.get_input("Company Website (optional)", required=False, default="")
 
         # Section 2: Target Audience
-        print("\n" + "="*70)
+        print(_NL_SEP)
         print("👥 SECTION 2: TARGET AUDIENCE\n")
 
         self.data['target_audience'] = self.get_multiline_input(
@@ -121,36 +186,22 @@ class BrandInputCollector:
         )
 
         # Section 3: Business Goals
-        print("\n" + "="*70)
+        print(_NL_SEP)
         print("🎯 SECTION 3: BUSINESS GOALS\n")
 
-        goals = [
-            "Brand Awareness",
-            "Lead Generation",
-            "Sales",
-            "Product Education",
-            "Community Building",
-            "Customer Retention",
-            "Thought Leadership"
-        ]
         self.data['business_goals'] = self.get_choice(
             "Select your primary business goals (up to 4):",
-            goals,
+            BUSINESS_GOALS,
             allow_multiple=True
         )
 
         # Section 4: Content Channels
-        print("\n" + "="*70)
+        print(_NL_SEP)
         print("📱 SECTION 4: CONTENT CHANNELS\n")
 
-        channels = [
-            "LinkedIn", "Twitter", "Instagram", "Facebook",
-            "TikTok", "Blog", "YouTube", "Pinterest",
-            "Email Newsletter", "Podcast", "Medium"
-        ]
         self.data['active_channels'] = self.get_choice(
             "Which channels do you want to focus on?",
-            channels,
+            CHANNELS,
             allow_multiple=True
         )
 
@@ -160,53 +211,23 @@ class BrandInputCollector:
         )
 
         # Section 5: Resources & Constraints
-        print("\n" + "="*70)
+        print(_NL_SEP)
         print("⚙️  SECTION 5: RESOURCES & CONSTRAINTS\n")
 
-        tones = [
-            "Professional & Corporate",
-            "Professional yet Approachable",
-            "Casual & Friendly",
-            "Playful & Fun",
-            "Authoritative & Expert",
-            "Inspirational & Aspirational"
-        ]
-        self.data['brand_tone'] = self.get_choice("Select your brand tone:", tones)
-
-        budgets = [
-            "Under $500",
-            "$500 - $1,000",
-            "$1,000 - $2,500",
-            "$2,500 - $5,000",
-            "$5,000 - $10,000",
-            "$10,000+"
-        ]
-        self.data['monthly_budget'] = self.get_choice("Monthly content budget:", budgets)
-
-        time_commitments = [
-            "5-10 hours/week",
-            "10-20 hours/week",
-            "20-30 hours/week",
-            "30+ hours/week"
-        ]
-        self.data['time_commitment'] = self.get_choice("Weekly time commitment:", time_commitments)
-
-        resources = [
-            "In-house writer",
-            "In-house designer",
-            "In-house video editor",
-            "Freelancers",
-            "AI tools (ChatGPT, etc.)",
-            "No dedicated resources"
-        ]
+        self.data['brand_tone'] = self.get_choice("Select your brand tone:", TONES)
+
+        self.data['monthly_budget'] = self.get_choice("Monthly content budget:", BUDGETS)
+
+        self.data['time_commitment'] = self.get_choice("Weekly time commitment:", TIME_COMMITMENTS)
+
         self.data['resources'] = self.get_choice(
             "What content creation resources do you have?",
-            resources,
+            RESOURCES,
             allow_multiple=True
         )
 
         # Section 6: Brand Details
-        print("\n" + "="*70)
+        print(_NL_SEP)
         print("💡 SECTION 6: BRAND DETAILS\n")
 
         self.data['unique_value_prop'] = self.get_multiline_input(
@@ -221,7 +242,7 @@ class BrandInputCollector:
         )
 
         # Section 7: Additional Context
-        print("\n" + "="*70)
+        print(_NL_SEP)
         print("📝 SECTION 7: ADDITIONAL CONTEXT\n")
 
         self.data['competitors'] = self.get_input(
@@ -236,13 +257,9 @@ class BrandInputCollector:
             default=""
         )
 
-        months = [
-            "January 2025", "February 2025", "March 2025",
-            "April 2025", "May 2025", "June 2025"
-        ]
         self.data['strategy_month'] = self.get_choice(
             "Which month should we plan for?",
-            months
+            STRATEGY_MONTHS
         )
 
         self.data['additional_notes'] = self.get_input(
@@ -255,16 +272,18 @@ class BrandInputCollector:
 
     def display_summary(self):
         """Display collected information for confirmation"""
-        print("\n" + "="*70)
-        print("📊 SUMMARY OF YOUR INPUT")
-        print("="*70 + "\n")
-
-        print(f"Brand: {self.data['brand_name']}")
-        print(f"Industry: {self.data['industry']}")
-        print(f"Primary Channel: {self.data['primary_channel']}")
-        print(f"Business Goals: {', '.join(self.data['business_goals'])}")
-        print(f"Strategy Month: {self.data['strategy_month']}")
-        print("\n" + "="*70 + "\n")
+        sys.stdout.write(
+            f"{_NL_SEP}\n"
+            "📊 SUMMARY OF YOUR INPUT\n"
+            f"{_SEP_NL}\n"
+            f"Brand: {self.data['brand_name']}\n"
+            f"Industry: {self.data['industry']}\n"
+            f"Primary Channel: {self.data['primary_channel']}\n"
+            f"Business Goals: {', '.join(self.data['business_goals'])}\n"
+            f"Strategy Month: {self.data['strategy_month']}\n"
+            f"{_NL_SEP_NL}\n"
+        )
+        sys.stdout.flush()
 
     def confirm(self):
         """Ask user to confirm the input"""
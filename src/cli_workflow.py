@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import functools
 import os
 import sys
-from crewai import Agent, Task, Crew, Process, LLM
+import textwrap
 from dotenv import load_dotenv
-import json
-import yaml
+import orjson
 from datetime import datetime
 
 # Add src directory to path for imports
@@ -13,19 +14,175 @@ sys.path.insert(0, os.path.dirname(__file__))
 # Load environment variables
 load_dotenv()
 
-# Configure LLM to use OpenRouter with LiteLLM provider
-llm = LLM(
-    model="openai/anthropic/claude-3.5-sonnet",
-    api_key=os.getenv("OPENROUTER_API_KEY"),
-    base_url="https://openrouter.ai/api/v1",
-    temperature=0.7
-)
+from async_writer import AsyncArtifactWriter
 
+# Heavy dependencies (crewai, yaml, document generators) are imported inside
+# the workflow so the CLI prompts appear without waiting on them
 from cli_input import collect_brand_input
-from document_generator import generate_strategy_docx, generate_calendar_docx
-from excel_generator import generate_content_calendar_xlsx
 
-def run_cli_workflow():
+# One archetype per parallel strategy task
+STRATEGY_ARCHETYPES = (
+    "Thought Leadership - Position as industry expert",
+    "Community Building - Focus on engagement and conversation",
+    "Educational Hub - Become the go-to learning resource",
+    "Product-Led Growth - Let the product speak through content",
+    "Customer Stories - Let customers be the heroes"
+)
+
+def _prompt(text):
+    """Dedent a task description so indentation isn't sent as prompt tokens"""
+    return textwrap.dedent(text).strip()
+
+@functools.cache
+def _get_llm():
+    """Create the OpenRouter LLM on first use"""
+    from api.http_pool import install_shared_http_client
+    from llm_cache import CachingLLM
+
+    install_shared_http_client()
+
+    # Configure LLM to use OpenRouter with LiteLLM provider; repeated prompts
+    # are served from the on-disk response cache
+    return CachingLLM(
+        model="openai/anthropic/claude-3.5-sonnet",
+        api_key=os.getenv("OPENROUTER_API_KEY"),
+        base_url="https://openrouter.ai/api/v1",
+        temperature=0.7
+    )
+
+def _mock_strategies():
+    """Mock strategy data for the strategy DOCX (we'll use actual data later)"""
+    strategies_list = []
+    for i in range(1, 6):
+        strategies_list.append({
+            "name": f"Strategy {i}",
+            "tagline": f"Strategy {i} approach",
+            "core_approach": "Strategic approach description",
+            "content_pillars": [
+                {"name": "Pillar 1", "description": "Description"},
+                {"name": "Pillar 2", "description": "Description"},
+            ],
+            "posting_frequency": {"LinkedIn": "3x/week", "Twitter": "5x/week"},
+            "content_mix": {"Educational": 60, "Promotional": 20, "Engagement": 20},
+            "top_5_ideas": [f"Content idea {j}" for j in range(1, 6)],
+            "expected_results": ["Result 1", "Result 2"],
+            "pros": ["Pro 1", "Pro 2"],
+            "cons": ["Con 1", "Con 2"]
+        })
+    return strategies_list
+
+def _mock_content_pieces(fields):
+    """Mock calendar data for the calendar DOCX/XLSX"""
+    mock_content_pieces = []
+    for i in range(1, 21):
+        mock_content_pieces.append({
+            "content_id": i,
+            "week": (i-1)//5 + 1,
+            "suggested_date": f"{fields['MONTH_NAME']} {i}, 2025",
+            "title": f"Content Piece {i}: Title Here",
+            "channel": fields['CHANNEL'],
+            "format": "Text Post",
+            "pillar": f"Pillar {((i-1) % 3) + 1}",
+            "description": f"Description for content piece {i}",
+            "key_message": f"Key message {i}",
+            "call_to_action": "Take action",
+            "effort_level": "Medium",
+            "engagement_potential": "High",
+            "execution_notes": f"Execution notes for piece {i}"
+        })
+    return mock_content_pieces
+
+def _template_fields(brand_data_dict, selected_num):
+    """Dynamic fields patched into the cached mock document scaffolds"""
+    return {
+        "BRAND_NAME": brand_data_dict['brand_name'],
+        "SELECTED_NUM": str(selected_num),
+        "MONTH": brand_data_dict['strategy_month'],
+        "MONTH_NAME": brand_data_dict['strategy_month'].split()[0],
+        "CHANNEL": brand_data_dict['primary_channel']
+    }
+
+def generate_strategy_document(brand_data_dict, selected_num):
+    """Generate the strategy options DOCX (runs alongside Phase 2)"""
+    import document_generator
+    from doc_templates import render_from_template
+
+    def build(fields, path):
+        document_generator.generate_strategy_docx(
+            brand_name=fields['BRAND_NAME'],
+            strategies_list=_mock_strategies(),
+            recommendation=f"Strategy {fields['SELECTED_NUM']} recommended based on your brand analysis.",
+            output_path=path
+        )
+
+    # The mock document only varies by a few fields, so patch a cached scaffold
+    try:
+        render_from_template(
+            "strategy_options.docx", build,
+            _template_fields(brand_data_dict, selected_num),
+            "outputs/strategy_options.docx",
+            sources=(__file__, document_generator.__file__)
+        )
+        print("   ✅ strategy_options.docx")
+    except Exception as e:
+        print(f"   ⚠️  Strategy DOCX generation failed: {e}")
+
+def generate_calendar_documents(brand_data_dict, selected_num):
+    """Generate the content calendar DOCX and XLSX (runs alongside Phase 2)"""
+    import document_generator
+    import excel_generator
+    from doc_templates import render_from_template
+
+    fields = _template_fields(brand_data_dict, selected_num)
+
+    def build_docx(fields, path):
+        document_generator.generate_calendar_docx(
+            brand_name=fields['BRAND_NAME'],
+            strategy_name=f"Strategy {fields['SELECTED_NUM']}",
+            month=fields['MONTH'],
+            executive_summary="This content calendar brings your strategy to life with actionable content pieces.",
+            content_pieces=_mock_content_pieces(fields),
+            output_path=path
+        )
+
+    def build_xlsx(fields, path):
+        success_metrics = [
+            "Engagement rate > 3%",
+            "50+ qualified leads per month",
+            "Website traffic increase of 25%",
+            "Social follower growth of 15%"
+        ]
+
+        excel_generator.generate_content_calendar_xlsx(
+            brand_name=fields['BRAND_NAME'],
+            month=fields['MONTH'],
+            content_pieces=_mock_content_pieces(fields),
+            success_metrics=success_metrics,
+            output_path=path
+        )
+
+    try:
+        render_from_template(
+            "content_calendar.docx", build_docx, fields,
+            "outputs/content_calendar.docx",
+            sources=(__file__, document_generator.__file__)
+        )
+        print("   ✅ content_calendar.docx")
+    except Exception as e:
+        print(f"   ⚠️  Calendar DOCX generation failed: {e}")
+
+    # Generate Calendar XLSX
+    try:
+        render_from_template(
+            "content_calendar.xlsx", build_xlsx, fields,
+            "outputs/content_calendar.xlsx",
+            sources=(__file__, excel_generator.__file__)
+        )
+        print("   ✅ content_calendar.xlsx")
+    except Exception as e:
+        print(f"   ⚠️  XLSX generation failed: {e}")
+
+async def run_cli_workflow():
     """Run the full workflow with CLI input"""
 
     print("\n" + "="*70)
@@ -36,6 +193,14 @@ def run_cli_workflow():
     print("Step 1: Collecting brand information...")
     brand_data_text, brand_data_dict = collect_brand_input()
 
+    from crewai import Agent, Task, Crew, Process
+    import yaml
+
+    llm = _get_llm()
+
+    # Markdown/JSON/YAML artifacts are written in the background
+    writer = AsyncArtifactWriter()
+
     # Step 2: Create agents
     print("Step 2: Creating AI agents and tasks...\n")
 
@@ -58,7 +223,7 @@ def run_cli_workflow():
                      always complete your full assignment - if asked for 5 strategies, you deliver all 5.""",
         verbose=True,
         allow_delegation=False,
-        max_iter=25,
+        max_iter=5,
         llm=llm
     )
 
@@ -71,12 +236,12 @@ def run_cli_workflow():
                      content titles that could be published as-is.""",
         verbose=True,
         allow_delegation=False,
-        max_iter=35,
+        max_iter=5,
         llm=llm
     )
 
     analyze_brand = Task(
-        description=f"""
+        description=_prompt("""
         Analyze the following brand information and create a comprehensive brand profile:
 
         {brand_data_text}
@@ -92,47 +257,61 @@ def run_cli_workflow():
         8. Competitive Gaps
 
         Be specific and insightful.
-        """,
+        """).format(brand_data_text=brand_data_text.strip()),
         expected_output="A comprehensive brand analysis document",
         agent=brand_analyst
     )
 
-    generate_strategies = Task(
-        description="""
-        IMPORTANT: You must generate ALL 5 strategies in a single response.
-
-        Based on the brand analysis you received, create 5 COMPLETE AND DISTINCT content strategy options.
-
-        For EACH of the 5 strategies, provide (keep it concise):
-
-        **Strategy [NUMBER]: [Name]**
-        **Tagline:** One memorable sentence
-        **Core Approach:** 2-3 sentences
-        **Why This Strategy:** 1-2 sentences
-        **Content Pillars:** Pillar 1 | Pillar 2 | Pillar 3
-        **Posting Frequency:** LinkedIn [X]/week, Twitter [X]/week, Blog [X]/month
-        **Content Mix:** Educational [X]%, Promotional [X]%, Engagement [X]%, Curated [X]%
-        **Top 3 Content Ideas:**
-          1. [Title]
-          2. [Title]
-          3. [Title]
-        **Effort:** [X]hrs/week, Resources: [brief list]
-        **30-Day Results:** [Key metrics]
-        **Pros:** [2 key advantages]
-        **Cons:** [2 key challenges with brief mitigations]
+    # Fan out one task per strategy so the five LLM calls run concurrently;
+    # each gets a distinct archetype to keep the options fundamentally different.
+    # Async tasks run on separate threads and an agent keeps per-task executor
+    # state, so every fan-out task gets its own copy of the architect
+    strategy_tasks = []
+    for number, archetype in enumerate(STRATEGY_ARCHETYPES, 1):
+        strategy_tasks.append(Task(
+            description=_prompt(f"""
+            Based on the brand analysis you received, create content strategy option #{number}.
+
+            This strategy MUST follow the "{archetype}" archetype.
+
+            Provide (keep it concise):
+
+            **Strategy {number}: [Name]**
+            **Tagline:** One memorable sentence
+            **Core Approach:** 2-3 sentences
+            **Why This Strategy:** 1-2 sentences
+            **Content Pillars:** Pillar 1 | Pillar 2 | Pillar 3
+            **Posting Frequency:** LinkedIn [X]/week, Twitter [X]/week, Blog [X]/month
+            **Content Mix:** Educational [X]%, Promotional [X]%, Engagement [X]%, Curated [X]%
+            **Top 3 Content Ideas:**
+              1. [Title]
+              2. [Title]
+              3. [Title]
+            **Effort:** [X]hrs/week, Resources: [brief list]
+            **30-Day Results:** [Key metrics]
+            **Pros:** [2 key advantages]
+            **Cons:** [2 key challenges with brief mitigations]
+            """),
+            expected_output=f"One complete content strategy (Strategy {number}: {archetype})",
+            agent=strategy_architect.copy(),
+            context=[analyze_brand],
+            async_execution=True
+        ))
 
-        ---
+    generate_strategies = Task(
+        description=_prompt("""
+        You received 5 content strategy options for this brand.
 
-        After ALL 5 COMPLETE STRATEGIES, add:
+        Compare them against the brand analysis and add:
 
         ## RECOMMENDATION
         **Best Strategy for this brand:** Strategy [number]
         **Why:** [2-3 sentences explaining why this specific strategy fits best]
         **Week 1 Action Plan:** [3-5 specific steps to get started]
-        """,
-        expected_output="Exactly 5 complete, distinct content strategy options",
+        """),
+        expected_output="A recommendation section naming the best of the 5 strategies",
         agent=strategy_architect,
-        context=[analyze_brand]
+        context=[analyze_brand] + strategy_tasks
     )
 
     # Step 3: Run Phase 1
@@ -142,23 +321,22 @@ def run_cli_workflow():
     print("="*70 + "\n")
 
     phase1_crew = Crew(
-        agents=[brand_analyst, strategy_architect],
-        tasks=[analyze_brand, generate_strategies],
+        agents=[brand_analyst, strategy_architect] + [task.agent for task in strategy_tasks],
+        tasks=[analyze_brand] + strategy_tasks + [generate_strategies],
         process=Process.sequential,
         verbose=True
     )
 
-    strategies_result = phase1_crew.kickoff()
+    strategies_result = await phase1_crew.kickoff_async()
 
-    brand_analysis_output = analyze_brand.output.raw if hasattr(analyze_brand.output, 'raw') else str(analyze_brand.output)
-    strategies_output = str(strategies_result)
+    brand_analysis_output = analyze_brand.output.raw
+    strategies_output = "\n\n---\n\n".join(
+        [task.output.raw for task in strategy_tasks] + [str(strategies_result)]
+    )
 
     # Save Phase 1 outputs
-    with open("outputs/1_brand_analysis.md", "w", encoding="utf-8") as f:
-        f.write(brand_analysis_output)
-
-    with open("outputs/2_five_strategies.md", "w", encoding="utf-8") as f:
-        f.write(strategies_output)
+    writer.submit("outputs/1_brand_analysis.md", brand_analysis_output)
+    writer.submit("outputs/2_five_strategies.md", strategies_output)
 
     print("\n✅ Phase 1 Complete! 5 strategies generated.\n")
 
@@ -191,7 +369,7 @@ def run_cli_workflow():
     print("="*70 + "\n")
 
     build_calendar = Task(
-        description=f"""
+        description=_prompt(f"""
         IMPORTANT: You must generate ALL 20-25 content pieces in a single response.
 
         Create a detailed content calendar for {brand_data_dict['strategy_month']}
@@ -230,28 +408,43 @@ def run_cli_workflow():
         [3 pieces that are easy to create and high impact - list content #s]
 
         REMEMBER: Generate all 20-25 pieces before moving to the summary sections.
-        """,
+        """),
         expected_output="Complete content calendar with 20-25 pieces",
         agent=content_calendar_specialist,
-        context=[analyze_brand, generate_strategies]
+        context=[analyze_brand, strategy_tasks[selected_num - 1]]
     )
 
     phase2_crew = Crew(
         agents=[content_calendar_specialist],
         tasks=[build_calendar],
         process=Process.sequential,
-        verbose=True
+        stream=True
     )
 
-    calendar_result = phase2_crew.kickoff()
-    calendar_output = str(calendar_result)
+    # The DOCX/XLSX documents are built from mock data and don't depend on the
+    # calendar output, so build them while Phase 2 runs
+    strategy_docx_task = asyncio.create_task(
+        asyncio.to_thread(generate_strategy_document, brand_data_dict, selected_num)
+    )
+    calendar_docs_task = asyncio.create_task(
+        asyncio.to_thread(generate_calendar_documents, brand_data_dict, selected_num)
+    )
 
-    # Save Phase 2 outputs
-    with open("outputs/3_content_calendar.md", "w", encoding="utf-8") as f:
-        f.write(calendar_output)
+    # Echo the calendar as it is generated instead of waiting for the full
+    # completion (a cached response arrives as a single result, no chunks)
+    calendar_stream = await phase2_crew.kickoff_async()
+    async for chunk in calendar_stream:
+        sys.stdout.write(chunk.content)
+        sys.stdout.flush()
+    print()
 
-    # Create comprehensive package
-    comprehensive_output = f"""# AI Content Marketing Strategy - Complete Report
+    calendar_result = calendar_stream.result
+    calendar_output = str(calendar_result)
+
+    # Create comprehensive package as sections; the writer streams them to
+    # disk back to back instead of building one large string
+    comprehensive_parts = (
+        f"""# AI Content Marketing Strategy - Complete Report
 Brand: {brand_data_dict['brand_name']}
 Industry: {brand_data_dict['industry']}
 Selected Strategy: #{selected_num}
@@ -262,19 +455,25 @@ Generated: {datetime.now().strftime('%B %d, %Y')}
 
 # PART 1: BRAND ANALYSIS
 
-{brand_analysis_output}
+""",
+        brand_analysis_output,
+        """
 
 ---
 
 # PART 2: STRATEGY OPTIONS (5 Strategies)
 
-{strategies_output}
+""",
+        strategies_output,
+        f"""
 
 ---
 
 # PART 3: CONTENT CALENDAR (Strategy {selected_num})
 
-{calendar_output}
+""",
+        calendar_output,
+        f"""
 
 ---
 
@@ -288,9 +487,8 @@ Generated: {datetime.now().strftime('%B %d, %Y')}
 
 *Generated by AI Content Marketing Strategist (CrewAI) - CLI Mode*
 """
+    )
 
-    with open("outputs/complete_strategy_package.md", "w", encoding="utf-8") as f:
-        f.write(comprehensive_output)
 
     # Save structured outputs
     outputs = {
@@ -301,96 +499,29 @@ Generated: {datetime.now().strftime('%B %d, %Y')}
         "brand_info": brand_data_dict
     }
 
-    with open("outputs/cli_output.json", "w", encoding="utf-8") as f:
-        json.dump(outputs, f, indent=2, ensure_ascii=False)
-
-    with open("outputs/cli_output.yaml", "w", encoding="utf-8") as f:
-        yaml.dump(outputs, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # Save Phase 2 and structured outputs
+    writer.submit("outputs/3_content_calendar.md", calendar_output)
+    writer.submit("outputs/complete_strategy_package.md", comprehensive_parts)
+    writer.submit(
+        "outputs/cli_output.json",
+        orjson.dumps(outputs, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    )
+    writer.submit(
+        "outputs/cli_output.yaml",
+        yaml.dump(
+            outputs, Dumper=getattr(yaml, "CDumper", yaml.Dumper),
+            default_flow_style=False, allow_unicode=True, sort_keys=False
+        )
+    )
 
     # Generate DOCX files
     print("\n📄 Generating professional documents...\n")
 
-    # Mock data for DOCX (we'll use actual data later)
-    try:
-        strategies_list = []
-        for i in range(1, 6):
-            strategies_list.append({
-                "name": f"Strategy {i}",
-                "tagline": f"Strategy {i} approach",
-                "core_approach": "Strategic approach description",
-                "content_pillars": [
-                    {"name": "Pillar 1", "description": "Description"},
-                    {"name": "Pillar 2", "description": "Description"},
-                ],
-                "posting_frequency": {"LinkedIn": "3x/week", "Twitter": "5x/week"},
-                "content_mix": {"Educational": 60, "Promotional": 20, "Engagement": 20},
-                "top_5_ideas": [f"Content idea {j}" for j in range(1, 6)],
-                "expected_results": ["Result 1", "Result 2"],
-                "pros": ["Pro 1", "Pro 2"],
-                "cons": ["Con 1", "Con 2"]
-            })
-
-        generate_strategy_docx(
-            brand_name=brand_data_dict['brand_name'],
-            strategies_list=strategies_list,
-            recommendation=f"Strategy {selected_num} recommended based on your brand analysis.",
-            output_path="outputs/strategy_options.docx"
-        )
-        print("   ✅ strategy_options.docx")
-    except Exception as e:
-        print(f"   ⚠️  Strategy DOCX generation failed: {e}")
-
-    try:
-        # Mock calendar data
-        mock_content_pieces = []
-        for i in range(1, 21):
-            mock_content_pieces.append({
-                "content_id": i,
-                "week": (i-1)//5 + 1,
-                "suggested_date": f"{brand_data_dict['strategy_month'].split()[0]} {i}, 2025",
-                "title": f"Content Piece {i}: Title Here",
-                "channel": brand_data_dict['primary_channel'],
-                "format": "Text Post",
-                "pillar": f"Pillar {((i-1) % 3) + 1}",
-                "description": f"Description for content piece {i}",
-                "key_message": f"Key message {i}",
-                "call_to_action": "Take action",
-                "effort_level": "Medium",
-                "engagement_potential": "High",
-                "execution_notes": f"Execution notes for piece {i}"
-            })
-
-        generate_calendar_docx(
-            brand_name=brand_data_dict['brand_name'],
-            strategy_name=f"Strategy {selected_num}",
-            month=brand_data_dict['strategy_month'],
-            executive_summary="This content calendar brings your strategy to life with actionable content pieces.",
-            content_pieces=mock_content_pieces,
-            output_path="outputs/content_calendar.docx"
-        )
-        print("   ✅ content_calendar.docx")
-    except Exception as e:
-        print(f"   ⚠️  Calendar DOCX generation failed: {e}")
-
-    # Generate Calendar XLSX
-    try:
-        success_metrics = [
-            "Engagement rate > 3%",
-            "50+ qualified leads per month",
-            "Website traffic increase of 25%",
-            "Social follower growth of 15%"
-        ]
+    await asyncio.gather(strategy_docx_task, calendar_docs_task)
 
-        xlsx_path = generate_content_calendar_xlsx(
-            brand_name=brand_data_dict['brand_name'],
-            month=brand_data_dict['strategy_month'],
-            content_pieces=mock_content_pieces,
-            success_metrics=success_metrics,
-            output_path="outputs/content_calendar.xlsx"
-        )
-        print("   ✅ content_calendar.xlsx")
-    except Exception as e:
-        print(f"   ⚠️  XLSX generation failed: {e}")
+    # Make sure every queued artifact is on disk before reporting
+    for path, error in writer.flush_and_join():
+        print(f"   ⚠️  Failed to write {path}: {error}")
 
     # Final summary
     print("\n" + "="*70)
@@ -419,9 +550,36 @@ Generated: {datetime.now().strftime('%B %d, %Y')}
     print("   open outputs/content_calendar.docx")
     print("   open outputs/content_calendar.xlsx\n")
 
+def run_batch_workflow(brands_path, out_dir):
+    """Generate strategy packages for every brand in a JSONL file"""
+    from batch_runner import load_brand_inputs, run_batch
+
+    brand_inputs = load_brand_inputs(brands_path)
+
+    print("\n" + "="*70)
+    print(f"🚀 AI CONTENT MARKETING STRATEGIST - BATCH MODE ({len(brand_inputs)} brands)")
+    print("="*70 + "\n")
+
+    failures = run_batch(brand_inputs, out_dir)
+    for name, error in failures:
+        print(f"   ⚠️  {name}: {error}")
+
+    print(f"\n✅ {len(brand_inputs) - len(failures)}/{len(brand_inputs)} packages written to {out_dir}/\n")
+
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="AI Content Marketing Strategist (CLI)")
+    parser.add_argument("--batch", metavar="BRANDS_JSONL",
+                        help="Generate packages non-interactively for each brand in a JSONL file")
+    parser.add_argument("--out", default="outputs", help="Output directory for --batch")
+    args = parser.parse_args()
+
     try:
-        run_cli_workflow()
+        if args.batch:
+            run_batch_workflow(args.batch, args.out)
+        else:
+            asyncio.run(run_cli_workflow())
     except KeyboardInterrupt:
         print("\n\n❌ Workflow cancelled by user")
         sys.exit(0)
@@ -1,18 +1,169 @@
+import copy
+import functools
 import os
-from apify_client import ApifyClient
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 from typing import List, Dict, Optional
 
+# Competitor input parsing: comma separators (with surrounding whitespace),
+# LinkedIn detection (any case) and the slug after the last (case-sensitive)
+# /company/ segment
+_COMPETITOR_SPLIT_RE = re.compile(r'\s*,\s*')
+_LINKEDIN_RE = re.compile(r'linkedin\.com', re.IGNORECASE)
+_COMPANY_SLUG_RE = re.compile(r'.*/company/([^/]*)', re.DOTALL)
+
+# Mock platform data and canned analysis (built once, deep-copied per call so
+# callers can mutate their results without touching the shared constants)
+_LINKEDIN_MOCK = {
+    "followers": 15420,
+    "posts_analyzed": 30,
+    "posting_frequency": "3-4 posts per week",
+    "avg_engagement_rate": 2.8,
+    "content_themes": [
+        "Product updates and features",
+        "Customer success stories",
+        "Industry thought leadership",
+        "Company culture and hiring"
+    ],
+    "top_performing_content": [
+        {
+            "type": "video",
+            "topic": "Product demo",
+            "engagement_rate": 8.5
+        },
+        {
+            "type": "customer_story",
+            "topic": "Case study with Fortune 500",
+            "engagement_rate": 6.2
+        },
+        {
+            "type": "carousel",
+            "topic": "Industry trends",
+            "engagement_rate": 5.1
+        }
+    ],
+    "content_formats": {
+        "text_only": 20,
+        "image": 35,
+        "video": 25,
+        "carousel": 15,
+        "link": 5
+    },
+    "posting_times": {
+        "best_day": "Tuesday",
+        "best_time": "9-11 AM EST"
+    }
+}
+
+_TWITTER_MOCK = {
+    "followers": 8930,
+    "tweets_analyzed": 30,
+    "posting_frequency": "5-7 tweets per day",
+    "avg_engagement_rate": 1.5,
+    "content_themes": [
+        "Quick tips and insights",
+        "Industry news commentary",
+        "Engagement with community",
+        "Product announcements"
+    ],
+    "top_performing_tweets": [
+        {
+            "type": "thread",
+            "topic": "How-to guide",
+            "engagement_rate": 4.2
+        },
+        {
+            "type": "poll",
+            "topic": "Community question",
+            "engagement_rate": 3.8
+        }
+    ],
+    "content_formats": {
+        "text_only": 50,
+        "image": 25,
+        "video": 15,
+        "thread": 10
+    },
+    "engagement_tactics": [
+        "Asks questions to spark discussion",
+        "Uses relevant hashtags (2-3 per tweet)",
+        "Retweets industry influencers",
+        "Quick response to mentions"
+    ]
+}
+
+_INSIGHTS = (
+    "Competitors post 3-4x/week on LinkedIn with video content getting 2-3x higher engagement",
+    "Customer success stories and case studies consistently perform well across all competitors",
+    "Most competitors underutilize Twitter threads for thought leadership - opportunity here",
+    "Tuesday and Thursday mornings (9-11 AM) show highest engagement on LinkedIn",
+    "Carousel posts explaining complex topics get strong engagement but are rarely used",
+    "Behind-the-scenes and culture content gets lower engagement - focus on value-driven content"
+)
+
+_CONTENT_GAPS = (
+    "No competitor is publishing original research or data-driven reports",
+    "Limited use of customer-generated content and testimonials",
+    "Lack of educational series or multi-part content journeys",
+    "No consistent use of interactive content (polls, quizzes, calculators)",
+    "Missing: Product comparison content (this vs alternatives)",
+    "Gap in addressing common objections and concerns directly"
+)
+
+_OPPORTUNITIES = (
+    "Be the first to publish industry benchmark reports - establishes authority",
+    "Create a customer spotlight series with video testimonials",
+    "Launch an educational content series positioning as the learning hub",
+    "Use Twitter polls to engage audience and gather insights for content",
+    "Develop honest comparison content showing when to use competitors vs your solution",
+    "Address objections head-on with FAQ-style content and transparency"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _summary_for(total_competitors: int) -> Dict:
+    """Build the competitor landscape summary for a given competitor count"""
+    avg_linkedin_posting = 3.5  # posts per week (would calculate from real data)
+    avg_twitter_posting = 6.0   # posts per week
+
+    return {
+        "total_analyzed": total_competitors,
+        "platforms_covered": ["LinkedIn", "Twitter"],
+        "avg_linkedin_frequency": f"{avg_linkedin_posting} posts/week",
+        "avg_twitter_frequency": f"{avg_twitter_posting} posts/week",
+        "most_common_themes": [
+            "Product education",
+            "Customer stories",
+            "Industry trends",
+            "Company updates"
+        ],
+        "dominant_formats": [
+            "Short-form video (high engagement)",
+            "Carousel posts (LinkedIn)",
+            "Twitter threads (detailed topics)"
+        ]
+    }
+
+
 class CompetitorAnalyzer:
     """Analyze competitor digital marketing content"""
 
     def __init__(self, apify_token: Optional[str] = None):
-        """Initialize with Apify credentials"""
+        """
+        Initialize with Apify credentials
+
+        Args:
+            apify_token: Apify API token (defaults to APIFY_API_TOKEN)
+        """
         self.apify_token = apify_token or os.getenv('APIFY_API_TOKEN')
         if not self.apify_token:
             raise ValueError("APIFY_API_TOKEN not found in environment variables")
 
+        # Imported here so modules that only use the parsing helpers skip apify_client
+        from apify_client import ApifyClient
+
         self.client = ApifyClient(self.apify_token)
 
     def analyze_linkedin_competitor(self, company_url: str) -> Dict:
@@ -25,12 +176,38 @@ class CompetitorAnalyzer:
         Returns:
             Dictionary with competitor insights
         """
-        print(f"  🔍 Analyzing LinkedIn: {company_url}")
+        return self._batch_linkedin([company_url])[company_url]
+
+    def analyze_twitter_competitor(self, twitter_handle: str) -> Dict:
+        """
+        Analyze a competitor's Twitter/X presence
+
+        Args:
+            twitter_handle: Twitter handle (without @)
+
+        Returns:
+            Dictionary with competitor insights
+        """
+        return self._batch_twitter([twitter_handle])[twitter_handle]
+
+    def _batch_linkedin(self, company_urls: List[str]) -> Dict[str, Dict]:
+        """
+        Analyze several LinkedIn company pages in a single actor run
+
+        Args:
+            company_urls: LinkedIn company page URLs
+
+        Returns:
+            Dictionary mapping each URL to its competitor insights
+        """
+        for company_url in company_urls:
+            print(f"  🔍 Analyzing LinkedIn: {company_url}")
 
         try:
-            # Use Apify's LinkedIn Company Scraper
+            # Use Apify's LinkedIn Company Scraper; one run covers every URL
+            # so actor start-up is paid once per platform, not once per competitor
             run_input = {
-                "startUrls": [{"url": company_url}],
+                "startUrls": [{"url": url} for url in company_urls],
                 "maxPosts": 30,  # Last 30 posts
                 "includeFollowers": True
             }
@@ -39,39 +216,41 @@ class CompetitorAnalyzer:
             # Using a free alternative for now
             print(f"     Note: Using mock data for LinkedIn (Apify actor requires credits)")
 
-            # Mock response structure (replace with actual Apify call in production)
-            return self._mock_linkedin_data(company_url)
+            # Mock response structure (replace with actual Apify call in production:
+            # call the actor once with run_input, then group dataset items by input URL)
+            return {url: self._mock_linkedin_data(url) for url in company_urls}
 
         except Exception as e:
             print(f"     ⚠️  Error analyzing LinkedIn: {str(e)}")
-            return self._mock_linkedin_data(company_url)
+            return {url: self._mock_linkedin_data(url) for url in company_urls}
 
-    def analyze_twitter_competitor(self, twitter_handle: str) -> Dict:
+    def _batch_twitter(self, twitter_handles: List[str]) -> Dict[str, Dict]:
         """
-        Analyze a competitor's Twitter/X presence
+        Analyze several Twitter/X accounts in a single actor run
 
         Args:
-            twitter_handle: Twitter handle (without @)
+            twitter_handles: Twitter handles (without @)
 
         Returns:
-            Dictionary with competitor insights
+            Dictionary mapping each handle to its competitor insights
         """
-        print(f"  🔍 Analyzing Twitter: @{twitter_handle}")
+        for twitter_handle in twitter_handles:
+            print(f"  🔍 Analyzing Twitter: @{twitter_handle}")
 
         try:
-            # Use Apify's Twitter Scraper
+            # Use Apify's Twitter Scraper; one run covers every handle
             run_input = {
-                "handles": [twitter_handle],
+                "handles": list(twitter_handles),
                 "tweetsDesired": 30,
                 "includeSearchTerms": False
             }
 
             print(f"     Note: Using mock data for Twitter (Apify actor requires credits)")
-            return self._mock_twitter_data(twitter_handle)
+            return {handle: self._mock_twitter_data(handle) for handle in twitter_handles}
 
         except Exception as e:
             print(f"     ⚠️  Error analyzing Twitter: {str(e)}")
-            return self._mock_twitter_data(twitter_handle)
+            return {handle: self._mock_twitter_data(handle) for handle in twitter_handles}
 
     def analyze_competitors(self, competitors: List[Dict[str, str]]) -> Dict:
         """
@@ -94,27 +273,50 @@ class CompetitorAnalyzer:
             "opportunities": []
         }
 
-        for competitor in competitors:
+        # Collect targets per platform so each platform needs a single actor run
+        linkedin_targets = []
+        twitter_targets = []
+        for index, competitor in enumerate(competitors):
             comp_name = competitor.get('name', 'Unknown')
             print(f"📊 Competitor: {comp_name}")
 
-            comp_data = {
+            results['competitors'].append({
                 "name": comp_name,
                 "platforms": {}
-            }
+            })
 
-            # Analyze LinkedIn
             if 'linkedin_url' in competitor and competitor['linkedin_url']:
-                linkedin_data = self.analyze_linkedin_competitor(competitor['linkedin_url'])
-                comp_data['platforms']['linkedin'] = linkedin_data
+                linkedin_targets.append((index, competitor['linkedin_url']))
 
-            # Analyze Twitter
             if 'twitter_handle' in competitor and competitor['twitter_handle']:
-                twitter_data = self.analyze_twitter_competitor(competitor['twitter_handle'])
-                comp_data['platforms']['twitter'] = twitter_data
+                twitter_targets.append((index, competitor['twitter_handle']))
+
+        jobs = [
+            (platform, batch, targets)
+            for platform, batch, targets in (
+                ('linkedin', self._batch_linkedin, linkedin_targets),
+                ('twitter', self._batch_twitter, twitter_targets)
+            )
+            if targets
+        ]
+
+        if jobs:
+            # The per-platform batches are independent, so run them concurrently
+            # (at most one actor run per platform)
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [
+                    (platform, targets, executor.submit(
+                        batch, list(dict.fromkeys(t for _, t in targets))
+                    ))
+                    for platform, batch, targets in jobs
+                ]
+
+                for platform, targets, future in futures:
+                    batch_results = future.result()
+                    for index, target in targets:
+                        results['competitors'][index]['platforms'][platform] = batch_results[target]
 
-            results['competitors'].append(comp_data)
-            print("")  # Blank line between competitors
+        print("")
 
         # Generate summary insights
         results['summary'] = self._generate_summary(results['competitors'])
@@ -128,143 +330,27 @@ class CompetitorAnalyzer:
 
     def _mock_linkedin_data(self, company_url: str) -> Dict:
         """Generate mock LinkedIn data for testing"""
-        return {
-            "followers": 15420,
-            "posts_analyzed": 30,
-            "posting_frequency": "3-4 posts per week",
-            "avg_engagement_rate": 2.8,
-            "content_themes": [
-                "Product updates and features",
-                "Customer success stories",
-                "Industry thought leadership",
-                "Company culture and hiring"
-            ],
-            "top_performing_content": [
-                {
-                    "type": "video",
-                    "topic": "Product demo",
-                    "engagement_rate": 8.5
-                },
-                {
-                    "type": "customer_story",
-                    "topic": "Case study with Fortune 500",
-                    "engagement_rate": 6.2
-                },
-                {
-                    "type": "carousel",
-                    "topic": "Industry trends",
-                    "engagement_rate": 5.1
-                }
-            ],
-            "content_formats": {
-                "text_only": 20,
-                "image": 35,
-                "video": 25,
-                "carousel": 15,
-                "link": 5
-            },
-            "posting_times": {
-                "best_day": "Tuesday",
-                "best_time": "9-11 AM EST"
-            }
-        }
+        return copy.deepcopy(_LINKEDIN_MOCK)
 
     def _mock_twitter_data(self, handle: str) -> Dict:
         """Generate mock Twitter data for testing"""
-        return {
-            "followers": 8930,
-            "tweets_analyzed": 30,
-            "posting_frequency": "5-7 tweets per day",
-            "avg_engagement_rate": 1.5,
-            "content_themes": [
-                "Quick tips and insights",
-                "Industry news commentary",
-                "Engagement with community",
-                "Product announcements"
-            ],
-            "top_performing_tweets": [
-                {
-                    "type": "thread",
-                    "topic": "How-to guide",
-                    "engagement_rate": 4.2
-                },
-                {
-                    "type": "poll",
-                    "topic": "Community question",
-                    "engagement_rate": 3.8
-                }
-            ],
-            "content_formats": {
-                "text_only": 50,
-                "image": 25,
-                "video": 15,
-                "thread": 10
-            },
-            "engagement_tactics": [
-                "Asks questions to spark discussion",
-                "Uses relevant hashtags (2-3 per tweet)",
-                "Retweets industry influencers",
-                "Quick response to mentions"
-            ]
-        }
+        return copy.deepcopy(_TWITTER_MOCK)
 
     def _generate_summary(self, competitors: List[Dict]) -> Dict:
         """Generate high-level summary of competitor landscape"""
-        total_competitors = len(competitors)
-
-        avg_linkedin_posting = 3.5  # posts per week (would calculate from real data)
-        avg_twitter_posting = 6.0   # posts per week
-
-        return {
-            "total_analyzed": total_competitors,
-            "platforms_covered": ["LinkedIn", "Twitter"],
-            "avg_linkedin_frequency": f"{avg_linkedin_posting} posts/week",
-            "avg_twitter_frequency": f"{avg_twitter_posting} posts/week",
-            "most_common_themes": [
-                "Product education",
-                "Customer stories",
-                "Industry trends",
-                "Company updates"
-            ],
-            "dominant_formats": [
-                "Short-form video (high engagement)",
-                "Carousel posts (LinkedIn)",
-                "Twitter threads (detailed topics)"
-            ]
-        }
+        return copy.deepcopy(_summary_for(len(competitors)))
 
     def _generate_insights(self, competitors: List[Dict]) -> List[str]:
         """Generate actionable insights from competitor analysis"""
-        return [
-            "Competitors post 3-4x/week on LinkedIn with video content getting 2-3x higher engagement",
-            "Customer success stories and case studies consistently perform well across all competitors",
-            "Most competitors underutilize Twitter threads for thought leadership - opportunity here",
-            "Tuesday and Thursday mornings (9-11 AM) show highest engagement on LinkedIn",
-            "Carousel posts explaining complex topics get strong engagement but are rarely used",
-            "Behind-the-scenes and culture content gets lower engagement - focus on value-driven content"
-        ]
+        return list(_INSIGHTS)
 
     def _identify_gaps(self, competitors: List[Dict]) -> List[str]:
         """Identify what competitors are NOT doing"""
-        return [
-            "No competitor is publishing original research or data-driven reports",
-            "Limited use of customer-generated content and testimonials",
-            "Lack of educational series or multi-part content journeys",
-            "No consistent use of interactive content (polls, quizzes, calculators)",
-            "Missing: Product comparison content (this vs alternatives)",
-            "Gap in addressing common objections and concerns directly"
-        ]
+        return list(_CONTENT_GAPS)
 
     def _identify_opportunities(self, competitors: List[Dict]) -> List[str]:
         """Identify strategic opportunities based on gaps"""
-        return [
-            "Be the first to publish industry benchmark reports - establishes authority",
-            "Create a customer spotlight series with video testimonials",
-            "Launch an educational content series positioning as the learning hub",
-            "Use Twitter polls to engage audience and gather insights for content",
-            "Develop honest comparison content showing when to use competitors vs your solution",
-            "Address objections head-on with FAQ-style content and transparency"
-        ]
+        return list(_OPPORTUNITIES)
 
     def format_for_agent(self, analysis: Dict) -> str:
         """
@@ -276,49 +362,49 @@ class CompetitorAnalyzer:
         Returns:
             Formatted string for agent context
         """
-        output = "# Competitor Digital Marketing Analysis\n\n"
-
-        output += "## Overview\n"
-        output += f"- Total competitors analyzed: {analysis['summary']['total_analyzed']}\n"
-        output += f"- Platforms: {', '.join(analysis['summary']['platforms_covered'])}\n"
-        output += f"- LinkedIn posting frequency: {analysis['summary']['avg_linkedin_frequency']}\n"
-        output += f"- Twitter posting frequency: {analysis['summary']['avg_twitter_frequency']}\n\n"
-
-        output += "## Key Insights\n"
-        for insight in analysis['insights']:
-            output += f"- {insight}\n"
-        output += "\n"
-
-        output += "## Content Gaps (What Competitors Are NOT Doing)\n"
-        for gap in analysis['content_gaps']:
-            output += f"- {gap}\n"
-        output += "\n"
-
-        output += "## Strategic Opportunities\n"
-        for opp in analysis['opportunities']:
-            output += f"- {opp}\n"
-        output += "\n"
-
-        output += "## Detailed Competitor Breakdown\n"
+        summary = analysis['summary']
+        parts = [
+            "# Competitor Digital Marketing Analysis\n\n",
+            "## Overview\n",
+            f"- Total competitors analyzed: {summary['total_analyzed']}\n",
+            f"- Platforms: {', '.join(summary['platforms_covered'])}\n",
+            f"- LinkedIn posting frequency: {summary['avg_linkedin_frequency']}\n",
+            f"- Twitter posting frequency: {summary['avg_twitter_frequency']}\n\n",
+        ]
+        append = parts.append
+
+        append("## Key Insights\n")
+        parts.extend(f"- {insight}\n" for insight in analysis['insights'])
+        append("\n")
+
+        append("## Content Gaps (What Competitors Are NOT Doing)\n")
+        parts.extend(f"- {gap}\n" for gap in analysis['content_gaps'])
+        append("\n")
+
+        append("## Strategic Opportunities\n")
+        parts.extend(f"- {opp}\n" for opp in analysis['opportunities'])
+        append("\n")
+
+        append("## Detailed Competitor Breakdown\n")
         for comp in analysis['competitors']:
-            output += f"\n### {comp['name']}\n"
+            append(f"\n### {comp['name']}\n")
 
             if 'linkedin' in comp['platforms']:
                 linkedin = comp['platforms']['linkedin']
-                output += f"**LinkedIn:**\n"
-                output += f"- Followers: {linkedin['followers']:,}\n"
-                output += f"- Posting: {linkedin['posting_frequency']}\n"
-                output += f"- Engagement: {linkedin['avg_engagement_rate']}%\n"
-                output += f"- Top themes: {', '.join(linkedin['content_themes'][:3])}\n"
+                append("**LinkedIn:**\n")
+                append(f"- Followers: {linkedin['followers']:,}\n")
+                append(f"- Posting: {linkedin['posting_frequency']}\n")
+                append(f"- Engagement: {linkedin['avg_engagement_rate']}%\n")
+                append(f"- Top themes: {', '.join(linkedin['content_themes'][:3])}\n")
 
             if 'twitter' in comp['platforms']:
                 twitter = comp['platforms']['twitter']
-                output += f"**Twitter:**\n"
-                output += f"- Followers: {twitter['followers']:,}\n"
-                output += f"- Posting: {twitter['posting_frequency']}\n"
-                output += f"- Engagement: {twitter['avg_engagement_rate']}%\n"
+                append("**Twitter:**\n")
+                append(f"- Followers: {twitter['followers']:,}\n")
+                append(f"- Posting: {twitter['posting_frequency']}\n")
+                append(f"- Engagement: {twitter['avg_engagement_rate']}%\n")
 
-        return output
+        return "".join(parts)
 
 
 def parse_competitor_input(competitor_string: str) -> List[Dict[str, str]]:
@@ -335,20 +421,20 @@ def parse_competitor_input(competitor_string: str) -> List[Dict[str, str]]:
         return []
 
     competitors = []
-    items = [x.strip() for x in competitor_string.split(',')]
 
-    for item in items:
+    for item in _COMPETITOR_SPLIT_RE.split(competitor_string.strip()):
         if not item:
             continue
 
         comp = {"name": item}
 
         # Try to detect LinkedIn URLs
-        if 'linkedin.com' in item.lower():
+        if _LINKEDIN_RE.search(item):
             comp['linkedin_url'] = item
             # Extract company name from URL
-            if '/company/' in item:
-                comp['name'] = item.split('/company/')[-1].split('/')[0].replace('-', ' ').title()
+            slug = _COMPANY_SLUG_RE.match(item)
+            if slug:
+                comp['name'] = slug.group(1).replace('-', ' ').title()
 
         # Try to detect Twitter handles
         elif item.startswith('@'):
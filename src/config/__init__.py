@@ -1,6 +1,7 @@
 """Configuration management modules"""
 # Intentionally simplified to avoid circular imports
 # Import directly: from config.secure_config import config
+# (always via the src-relative name, never src.config, so config is one instance)
 from .secure_config import SecureConfig, config, check_configuration, show_config_debug
 
 __all__ = ['SecureConfig', 'config', 'check_configuration', 'show_config_debug']
@@ -4,8 +4,10 @@ Handles environment detection and secrets management
 """
 
 import streamlit as st
+import copy
 import os
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 from enum import Enum
 
 
@@ -16,13 +18,120 @@ class Environment(Enum):
     TESTING = "testing"
 
 
+def _load_secrets_once() -> Dict[str, Any]:
+    """
+    Read Streamlit secrets into a plain dict
+
+    Accessing st.secrets checks for secrets.toml and raises when it is
+    missing, so it is probed once per process.
+
+    Returns:
+        Secrets dict (empty if none are configured)
+    """
+    try:
+        return dict(st.secrets)
+    except Exception:
+        return {}
+
+
+_SECRETS = _load_secrets_once()
+
+# Per-environment settings; shared read-only mappings, so callers can keep
+# references without copying
+_PROD_RATE_LIMIT = MappingProxyType({
+    'max_requests': 5,
+    'window_seconds': 3600  # 1 hour
+})
+_DEV_RATE_LIMIT = MappingProxyType({
+    'max_requests': 999999,
+    'window_seconds': 1
+})
+
+_MODEL_CONFIG = MappingProxyType({
+    'model': 'anthropic/claude-sonnet-4-5:beta',
+    'temperature': 0.7,
+    'max_tokens': 16000,
+    'timeout': 120  # 2 minutes
+})
+
+_RETRY_CONFIG = MappingProxyType({
+    'max_retries': 3,
+    'backoff_factor': 2,  # 2^n seconds between retries
+    'retry_on_status': (429, 500, 502, 503, 504)
+})
+
+_PROD_FILE_CONFIG = MappingProxyType({
+    'use_temp_files': True,
+    'auto_cleanup': True,
+    'max_file_size_mb': 10
+})
+_DEV_FILE_CONFIG = MappingProxyType({
+    'use_temp_files': False,
+    'auto_cleanup': False,
+    'max_file_size_mb': 50
+})
+
+_PROD_LOGGING_CONFIG = MappingProxyType({
+    'level': 'INFO',
+    'sanitize_pii': True,
+    'include_timestamps': True,
+    'include_user_context': False
+})
+_DEV_LOGGING_CONFIG = MappingProxyType({
+    'level': 'DEBUG',
+    'sanitize_pii': False,
+    'include_timestamps': True,
+    'include_user_context': True
+})
+
+# Variables that decide the environment (also shown in the debug panel)
+_ENV_KEYS = ('ENVIRONMENT', 'STREAMLIT_SHARING_MODE', 'STREAMLIT_RUNTIME_ENV')
+
+
 class SecureConfig:
     """Secure configuration manager"""
 
     def __init__(self):
         """Initialize configuration"""
+        # Snapshot the environment indicators once per process
+        self._env: Dict[str, Optional[str]] = {name: os.environ.get(name) for name in _ENV_KEYS}
         self.environment = self._detect_environment()
 
+        # Environment variables shown in the debug panel
+        self.env_vars: Dict[str, str] = {
+            name: 'Not set' if value is None else value
+            for name, value in self._env.items()
+        }
+
+        # Secret lookups are resolved once per process; misses are cached as None
+        self._secrets: Dict[str, Optional[str]] = {}
+
+        # Debug summary, built on first use (production never shows it)
+        self._config_summary: Optional[Dict[str, Any]] = None
+
+    def _get_secret(self, key_name: str) -> Optional[str]:
+        """
+        Look up a secret in Streamlit secrets, then the environment
+
+        Args:
+            key_name: Secret / environment variable name
+
+        Returns:
+            Secret value or None if not found
+        """
+        if key_name in self._secrets:
+            return self._secrets[key_name]
+
+        # Try Streamlit secrets first (production)
+        value = _SECRETS.get(key_name)
+
+        # Fall back to environment variables (development)
+        if value is None:
+            value = os.getenv(key_name)
+
+        self._secrets[key_name] = value
+        return value
+
     def _detect_environment(self) -> Environment:
         """
         Detect current environment
@@ -30,12 +139,14 @@ class SecureConfig:
         Returns:
             Environment enum value
         """
+        env_map = self._env
+
         # Check for Streamlit Cloud indicators
-        if os.getenv('STREAMLIT_SHARING_MODE') or os.getenv('STREAMLIT_RUNTIME_ENV') == 'cloud':
+        if env_map['STREAMLIT_SHARING_MODE'] or env_map['STREAMLIT_RUNTIME_ENV'] == 'cloud':
             return Environment.PRODUCTION
 
         # Check for explicit environment variable
-        env = os.getenv('ENVIRONMENT', 'development').lower()
+        env = (env_map['ENVIRONMENT'] or 'development').lower()
 
         if env in ['prod', 'production']:
             return Environment.PRODUCTION
@@ -66,17 +177,7 @@ class SecureConfig:
         Returns:
             API key or None if not found
         """
-        key_name = f"{service.upper()}_API_KEY"
-
-        # Try Streamlit secrets first (production)
-        try:
-            if hasattr(st, 'secrets') and key_name in st.secrets:
-                return st.secrets[key_name]
-        except Exception:
-            pass
-
-        # Fall back to environment variables (development)
-        return os.getenv(key_name)
+        return self._get_secret(f"{service.upper()}_API_KEY")
 
     def get_beta_password(self) -> Optional[str]:
         """
@@ -85,104 +186,52 @@ class SecureConfig:
         Returns:
             Beta password or None if not configured
         """
-        # Try Streamlit secrets first
-        try:
-            if hasattr(st, 'secrets') and 'BETA_PASSWORD' in st.secrets:
-                return st.secrets['BETA_PASSWORD']
-        except Exception:
-            pass
-
-        # Fall back to environment variable
-        return os.getenv('BETA_PASSWORD')
+        return self._get_secret('BETA_PASSWORD')
 
-    def get_rate_limit_config(self) -> Dict[str, int]:
+    def get_rate_limit_config(self) -> Mapping[str, int]:
         """
         Get rate limiting configuration
 
         Returns:
-            Dictionary with max_requests and window_seconds
+            Read-only mapping with max_requests and window_seconds
         """
-        if self.is_production():
-            # Strict limits in production
-            return {
-                'max_requests': 5,
-                'window_seconds': 3600  # 1 hour
-            }
-        else:
-            # Relaxed limits in development
-            return {
-                'max_requests': 999999,
-                'window_seconds': 1
-            }
+        return _PROD_RATE_LIMIT if self.is_production() else _DEV_RATE_LIMIT
 
-    def get_model_config(self) -> Dict[str, Any]:
+    def get_model_config(self) -> Mapping[str, Any]:
         """
         Get AI model configuration
 
         Returns:
-            Model configuration dictionary
+            Read-only model configuration mapping
         """
-        return {
-            'model': 'anthropic/claude-sonnet-4-5:beta',
-            'temperature': 0.7,
-            'max_tokens': 16000,
-            'timeout': 120  # 2 minutes
-        }
+        return _MODEL_CONFIG
 
-    def get_retry_config(self) -> Dict[str, Any]:
+    def get_retry_config(self) -> Mapping[str, Any]:
         """
         Get retry configuration for API calls
 
         Returns:
-            Retry configuration dictionary
+            Read-only retry configuration mapping
         """
-        return {
-            'max_retries': 3,
-            'backoff_factor': 2,  # 2^n seconds between retries
-            'retry_on_status': [429, 500, 502, 503, 504]
-        }
+        return _RETRY_CONFIG
 
-    def get_file_config(self) -> Dict[str, Any]:
+    def get_file_config(self) -> Mapping[str, Any]:
         """
         Get file handling configuration
 
         Returns:
-            File configuration dictionary
+            Read-only file configuration mapping
         """
-        if self.is_production():
-            return {
-                'use_temp_files': True,
-                'auto_cleanup': True,
-                'max_file_size_mb': 10
-            }
-        else:
-            return {
-                'use_temp_files': False,
-                'auto_cleanup': False,
-                'max_file_size_mb': 50
-            }
+        return _PROD_FILE_CONFIG if self.is_production() else _DEV_FILE_CONFIG
 
-    def get_logging_config(self) -> Dict[str, Any]:
+    def get_logging_config(self) -> Mapping[str, Any]:
         """
         Get logging configuration
 
         Returns:
-            Logging configuration dictionary
+            Read-only logging configuration mapping
         """
-        if self.is_production():
-            return {
-                'level': 'INFO',
-                'sanitize_pii': True,
-                'include_timestamps': True,
-                'include_user_context': False
-            }
-        else:
-            return {
-                'level': 'DEBUG',
-                'sanitize_pii': False,
-                'include_timestamps': True,
-                'include_user_context': True
-            }
+        return _PROD_LOGGING_CONFIG if self.is_production() else _DEV_LOGGING_CONFIG
 
     def validate_config(self) -> tuple[bool, list[str]]:
         """
@@ -215,8 +264,15 @@ class SecureConfig:
         Get summary of current configuration (for debugging)
 
         Returns:
-            Configuration summary dictionary
+            Configuration summary dictionary (a copy callers may modify)
         """
+        if self._config_summary is None:
+            self._config_summary = self._build_config_summary()
+
+        return copy.deepcopy(self._config_summary)
+
+    def _build_config_summary(self) -> Dict[str, Any]:
+        """Build the configuration summary returned by get_config_summary"""
         api_key = self.get_api_key()
         beta_password = self.get_beta_password()
 
@@ -225,10 +281,10 @@ class SecureConfig:
             'api_key_configured': bool(api_key),
             'api_key_preview': f"{api_key[:10]}..." if api_key else "Not configured",
             'beta_password_configured': bool(beta_password),
-            'rate_limit_config': self.get_rate_limit_config(),
-            'model_config': self.get_model_config(),
-            'file_config': self.get_file_config(),
-            'logging_config': self.get_logging_config()
+            'rate_limit_config': dict(self.get_rate_limit_config()),
+            'model_config': dict(self.get_model_config()),
+            'file_config': dict(self.get_file_config()),
+            'logging_config': dict(self.get_logging_config())
         }
 
 
@@ -267,9 +323,4 @@ def show_config_debug() -> None:
             st.json(summary)
 
             st.markdown("**Environment Variables:**")
-            env_vars = {
-                'ENVIRONMENT': os.getenv('ENVIRONMENT', 'Not set'),
-                'STREAMLIT_SHARING_MODE': os.getenv('STREAMLIT_SHARING_MODE', 'Not set'),
-                'STREAMLIT_RUNTIME_ENV': os.getenv('STREAMLIT_RUNTIME_ENV', 'Not set')
-            }
-            st.json(env_vars)
+            st.json(config.env_vars)
@@ -1,6 +1,216 @@
 import re
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import re2  # google-re2 (optional): linear-time DFA matching, no backtracking
+except ImportError:
+    re2 = None
+
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _compile(pattern: str, flags: int = 0):
+    """
+    Compile a parser pattern with RE2 when google-re2 is installed, else re
+
+    Only for patterns without lookarounds or backreferences (RE2 rejects
+    them); flags are passed inline since RE2 takes an Options object.
+    """
+    if re2 is None:
+        return re.compile(pattern, flags)
+
+    inline = ''.join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+    return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+
+
+# Calendar sections: one scan finds every heading; a section runs until the
+# next markdown heading or bold line (pillars: next "# X" or "**X")
+_RE_SECTION_HEAD = _compile(r'(EXECUTIVE SUMMARY|CONTENT PILLARS|SUCCESS METRICS|QUICK WINS)[:\n]+',
+                            re.IGNORECASE)
+_RE_SECTION_END = _compile(r'\n#|\n\*\*')
+_RE_PILLAR_SECTION_END = _compile(r'\n#{1,3}[^#]|\n\*\*[A-Z]', re.IGNORECASE)
+_RE_PILLAR_ITEM = _compile(r'(?:Pillar\s+(\d+)[:\s]+)([^\n]+?)(?:\n|$)', re.IGNORECASE)
+
+# Content pieces: "Content #1:" blocks, falling back to a numbered list
+_RE_PIECE_HEAD = _compile(r'Content\s*(?:Piece)?\s*#?\s*(\d+)[:\s]*([^\n]+)\n?', re.IGNORECASE)
+_RE_PIECE_BOUNDARY = _compile(r'Content\s*(?:Piece)?\s*#?\s*\d+', re.IGNORECASE)
+_RE_NUMBERED_ITEM = _compile(r'(?:^|\n)\s*(\d+)[\.\)]\s*([^\n]+)', re.MULTILINE)
+
+# Content piece field labels (lowercase, markup stripped) -> piece key
+_FIELD_KEYS = {
+    'week': 'week',
+    'date': 'suggested_date',
+    'suggested date': 'suggested_date',
+    'channel': 'channel',
+    'format': 'format',
+    'pillar': 'pillar',
+    'key message': 'key_message',
+    'description': 'description',
+    'call to action': 'call_to_action',
+    'cta': 'call_to_action',
+    'effort': 'effort_level',
+    'effort level': 'effort_level',
+    'effort explanation': 'effort_explanation',
+    'engagement': 'engagement_potential',
+    'engagement potential': 'engagement_potential',
+    'engagement reasoning': 'engagement_reasoning',
+    'seo keyword': 'seo_keyword',
+    'execution notes': 'execution_notes'
+}
+
+# Fields whose value continues on following lines until the next "Label:" line
+_MULTILINE_FIELDS = frozenset(('description', 'execution_notes'))
+
+_VALUE_STRIP = ' -•\n"\'*'
+_LABEL_STRIP = ' *#'
+
+
+# Template for every parsed content piece (all values immutable, so a shallow copy is safe)
+_EMPTY_PIECE = {
+    "content_id": 0,
+    "title": "",
+    "week": 0,
+    "suggested_date": "",
+    "channel": "",
+    "format": "",
+    "pillar": "",
+    "key_message": "",
+    "description": "",
+    "call_to_action": "",
+    "effort_level": "Medium",
+    "effort_explanation": "",
+    "engagement_potential": "Medium",
+    "engagement_reasoning": "",
+    "seo_keyword": "",
+    "execution_notes": ""
+}
+
+
+# Piece fields copied from JSON output (id and title are set by _new_piece)
+_PIECE_FIELDS = tuple(key for key in _EMPTY_PIECE if key not in ("content_id", "title"))
+
+# Calendar week of a content piece (5 pieces per week) for the usual id range
+_WEEK_OF = [(content_id - 1) // 5 + 1 for content_id in range(256)]
+
+
+def _new_piece(content_id: int, title: str) -> Dict:
+    """Content piece dict with default values"""
+    piece = _EMPTY_PIECE.copy()
+    piece["content_id"] = content_id
+    piece["title"] = title
+    piece["week"] = _WEEK_OF[content_id] if content_id < 256 else (content_id - 1) // 5 + 1
+    return piece
+
+
+def _new_strategy(strategy_number: int) -> Dict:
+    """Strategy dict with default values (fresh containers per strategy)"""
+    return {
+        "strategy_number": strategy_number,
+        "name": "",
+        "tagline": "",
+        "core_approach": "",
+        "content_pillars": [],
+        "posting_frequency": {},
+        "content_mix": {},
+        "top_5_ideas": [],
+        "pros": [],
+        "cons": []
+    }
+
+
+def _iter_blocks(head_re, boundary_re, text: str):
+    """
+    Yield (head match, body) for each block introduced by head_re
+
+    A body runs from the end of its head to the next boundary_re match (or
+    the end of the text, excluding a final newline). Anchor-then-slice keeps
+    this linear; a lazy DOTALL body with a lookahead would retry the
+    lookahead at every character.
+    """
+    pos = 0
+    while True:
+        head = head_re.search(text, pos)
+        if head is None:
+            return
+
+        start = head.end()
+        boundary = boundary_re.search(text, start)
+        if boundary is not None:
+            end = boundary.start()
+        else:
+            end = len(text)
+            if end > start and text.endswith('\n'):
+                end -= 1
+
+        yield head, text[start:end]
+        pos = end
+
+
+def _is_label_line(line: str) -> bool:
+    """True for lines that start a new "Label:" entry"""
+    label, sep, _ = line.partition(':')
+    return bool(sep) and all(c.isalnum() or c in ' _\t' for c in label)
+
+
+def _bullet_items(lines, skip_bold: bool = False) -> List[str]:
+    """Non-blank lines with bullet markers stripped (optionally skipping "*..." lines)"""
+    items = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not (skip_bold and stripped[0] == '*'):
+            items.append(line.strip(' -•\n'))
+    return items
+
+
+def _label_end(lowered: str, labels) -> int:
+    """End of the label that starts lowered, or -1 (labels: prefixes or a compiled pattern)"""
+    if isinstance(labels, tuple):
+        for label in labels:
+            if lowered.startswith(label) and lowered[len(label):len(label) + 1] in ('', ':', ' ', '\t'):
+                return len(label)
+        return -1
+
+    match = labels.match(lowered)
+    return match.end() if match else -1
+
+
+def _section_lines(lines: List[str], labels, stops: tuple = ()) -> Optional[List[str]]:
+    """
+    Lines of the first section introduced by one of labels
+
+    labels is a tuple of lowercase prefixes or a compiled pattern matched at
+    the start of the lowercased line. The first entry is the remainder of the
+    label line; the section ends at a bold heading ("**Word") or a line
+    starting with one of stops.
+    """
+    for index, line in enumerate(lines):
+        head = line.lstrip(_LABEL_STRIP)
+        end = _label_end(head.lower(), labels)
+        if end >= 0:
+            section = [head[end:].lstrip(': \t')]
+            for follow in lines[index + 1:]:
+                if (follow[:2] == '**' and follow[2:3].isalpha()) or follow.lower().startswith(stops):
+                    break
+                section.append(follow)
+            return section
+    return None
+
+# Strategies
+_RE_STRATEGY_HEAD = _compile(r'Strategy\s+#?\s*(\d+)[:\s]*([^\n]*)\n', re.IGNORECASE)
+_RE_STRATEGY_BOUNDARY = _compile(r'Strategy\s+#?\s*\d+|RECOMMENDATION|## RECOMMENDATION', re.IGNORECASE)
+# Name, tagline, core approach and pillars block in one pass; each field is
+# matched inside a lookahead so overlapping fields are still found
+_RE_STRATEGY_FIELDS = re.compile(
+    r'(?=(?:Name|Strategy Name)[:\s]+(?P<name>[^\n]+)'
+    r'|Tagline[:\s]+(?P<tagline>[^\n]+)'
+    r'|(?:Core Approach|Approach)[:\s]+(?P<core_approach>[^\n]+(?:\n(?![\w\s]*:)[^\n]+)*)'
+    r'|Content Pillars[:\s]+(?P<content_pillars>(?s:.*?))(?=\n\*\*[A-Z]|\nPosting|$))',
+    re.IGNORECASE
+)
+_RE_PILLAR_PAIR = _compile(r'[-•]\s*([^:\n]+):\s*([^\n]+)')
+# Ideas label: "Content Ideas" anywhere before the colon ("Top 3 Content Ideas:")
+_RE_IDEAS_LABEL = re.compile(r'[^:\n]*?content ideas(?![^:\s])')
 
 class ContentCalendarParser:
     """Parse AI-generated content calendar text into structured data"""
@@ -12,6 +222,11 @@ class ContentCalendarParser:
         Returns:
             Dict with executive_summary, content_pieces, pillars, etc.
         """
+        # Structured (JSON) output needs no text parsing
+        parsed = self.parse_calendar_output_json(calendar_text)
+        if parsed is not None:
+            return parsed
+
         result = {
             "executive_summary": "",
             "content_pieces": [],
@@ -21,47 +236,168 @@ class ContentCalendarParser:
             "quick_wins": []
         }
 
+        spans = self._section_spans(calendar_text)
+        sections = {name: calendar_text[body:end] for name, (_, body, end) in spans.items()}
+
         # Extract executive summary
-        exec_match = re.search(r'(?:EXECUTIVE SUMMARY|Executive Summary)[:\n]+(.*?)(?=\n#{1,3}|\n\*\*|$)',
-                              calendar_text, re.DOTALL | re.IGNORECASE)
-        if exec_match:
-            result['executive_summary'] = exec_match.group(1).strip()
+        if 'executive summary' in sections:
+            result['executive_summary'] = sections['executive summary'].strip()
 
         # Extract content pillars with descriptions
-        result['pillars'] = self._extract_pillars(calendar_text)
+        result['pillars'] = self._extract_pillars(calendar_text, sections)
 
-        # Extract content pieces
-        result['content_pieces'] = self._extract_content_pieces(calendar_text)
+        # Extract content pieces (the named sections hold none)
+        result['content_pieces'] = self._extract_content_pieces(
+            self._outside_sections(calendar_text, spans)
+        )
 
         # Extract success metrics
-        metrics_match = re.search(r'(?:SUCCESS METRICS|Success Metrics)[:\n]+(.*?)(?=\n#{1,3}|\n\*\*|$)',
-                                 calendar_text, re.DOTALL | re.IGNORECASE)
-        if metrics_match:
-            metrics_text = metrics_match.group(1)
-            result['success_metrics'] = [m.strip('- •\n') for m in metrics_text.split('\n') if m.strip()]
+        if 'success metrics' in sections:
+            result['success_metrics'] = _bullet_items(sections['success metrics'].splitlines())
 
         # Extract quick wins
-        qw_match = re.search(r'(?:QUICK WINS|Quick Wins)[:\n]+(.*?)(?=\n#{1,3}|\n\*\*|$)',
-                            calendar_text, re.DOTALL | re.IGNORECASE)
-        if qw_match:
-            qw_text = qw_match.group(1)
-            result['quick_wins'] = [q.strip('- •\n') for q in qw_text.split('\n') if q.strip()]
+        if 'quick wins' in sections:
+            result['quick_wins'] = _bullet_items(sections['quick wins'].splitlines())
 
         return result
 
-    def _extract_pillars(self, text: str) -> Dict[str, str]:
+    def parse_calendar_output_json(self, calendar_text: str) -> Optional[Dict]:
+        """
+        Parse calendar output given as a JSON object (bare or in a ```json block)
+
+        Returns:
+            Dict shaped like parse_calendar_output, or None if the text holds
+            no JSON calendar
+        """
+        candidate = calendar_text.strip()
+        if not candidate.startswith('{'):
+            fence = candidate.find('```json')
+            if fence == -1:
+                return None
+            start = fence + len('```json')
+            end = candidate.find('```', start)
+            candidate = candidate[start:end if end != -1 else len(candidate)]
+
+        try:
+            data = json.loads(candidate)
+        except ValueError:
+            return None
+
+        if not isinstance(data, dict) or not isinstance(data.get('content_pieces'), list):
+            return None
+
+        pieces = []
+        for index, item in enumerate(data['content_pieces'], 1):
+            if not isinstance(item, dict):
+                continue
+            try:
+                content_id = int(item.get('content_id', index))
+            except (TypeError, ValueError):
+                content_id = index
+
+            piece = _new_piece(content_id, str(item.get('title', '')))
+            for field in _PIECE_FIELDS:
+                value = item.get(field)
+                if value is not None and value != '':
+                    piece[field] = value if isinstance(value, (str, int)) else str(value)
+
+            # Week numbers are ints, like the default week
+            if not isinstance(piece['week'], int):
+                try:
+                    piece['week'] = int(piece['week'])
+                except ValueError:
+                    piece['week'] = (content_id - 1) // 5 + 1
+            pieces.append(piece)
+
+        pillars = data.get('pillars')
+        if isinstance(pillars, dict) and pillars:
+            pillars = {str(name): str(desc) for name, desc in pillars.items()}
+        else:
+            pillars = self._extract_pillars('')
+
+        weekly_breakdown = data.get('weekly_breakdown')
+        success_metrics = data.get('success_metrics')
+        quick_wins = data.get('quick_wins')
+
+        return {
+            "executive_summary": str(data.get('executive_summary') or ''),
+            "content_pieces": pieces,
+            "pillars": pillars,
+            "weekly_breakdown": weekly_breakdown if isinstance(weekly_breakdown, dict) else {},
+            "success_metrics": [str(m) for m in success_metrics] if isinstance(success_metrics, list) else [],
+            "quick_wins": [str(q) for q in quick_wins] if isinstance(quick_wins, list) else []
+        }
+
+    def _section_spans(self, text: str) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Locate the named calendar sections in one pass
+
+        Returns:
+            Dict of lowercase section name -> (heading line start, body start,
+            body end), first occurrence only
+        """
+        spans = {}
+
+        for match in _RE_SECTION_HEAD.finditer(text):
+            name = match.group(1).lower()
+            if name in spans:
+                continue
+
+            end_re = _RE_PILLAR_SECTION_END if name == 'content pillars' else _RE_SECTION_END
+            end = end_re.search(text, match.end())
+            spans[name] = (
+                text.rfind('\n', 0, match.start()) + 1,
+                match.end(),
+                end.start() if end else len(text)
+            )
+
+        return spans
+
+    def _split_sections(self, text: str) -> Dict[str, str]:
+        """
+        Split out the named calendar sections in one pass
+
+        Returns:
+            Dict of lowercase section name -> body (first occurrence only)
+        """
+        return {name: text[body:end] for name, (_, body, end) in self._section_spans(text).items()}
+
+    def _outside_sections(self, text: str, spans: Dict[str, Tuple[int, int, int]]) -> str:
+        """
+        Text with the named sections cut out, so the content piece scan skips
+        them and the last piece doesn't run on into a summary section
+
+        A section whose body contains content pieces (e.g. an unterminated
+        pillars list followed by "Content #1:" lines) is kept.
+        """
+        kept = []
+        pos = 0
+
+        for start, body, end in sorted(spans.values()):
+            if start < pos or _RE_PIECE_HEAD.search(text, body, end):
+                continue
+            kept.append(text[pos:start])
+            pos = end
+
+        if not kept:
+            return text
+
+        kept.append(text[pos:])
+        return ''.join(kept)
+
+    def _extract_pillars(self, text: str, sections: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Extract content pillars with their descriptions"""
         pillars = {}
 
         # Look for pillar definitions
-        pillar_section = re.search(r'(?:CONTENT PILLARS|Content Pillars)[:\n]+(.*?)(?=\n#{1,3}[^#]|\n\*\*[A-Z]|$)',
-                                  text, re.DOTALL | re.IGNORECASE)
+        if sections is None:
+            sections = self._split_sections(text)
+        pillar_text = sections.get('content pillars')
 
-        if pillar_section:
-            pillar_text = pillar_section.group(1)
+        if pillar_text is not None:
 
             # Match patterns like "Pillar 1: Name - Description" or "**Pillar 1:**"
-            pillar_matches = re.finditer(r'(?:Pillar\s+(\d+)[:\s]+)([^\n]+?)(?:\n|$)', pillar_text, re.IGNORECASE)
+            pillar_matches = _RE_PILLAR_ITEM.finditer(pillar_text)
 
             for match in pillar_matches:
                 pillar_num = f"Pillar {match.group(1)}"
@@ -84,110 +420,85 @@ class ContentCalendarParser:
 
         # Try to find structured content blocks first
         # Pattern 1: "Content #1:" or "Content Piece #1:" format
-        pattern1 = r'(?:Content\s*(?:Piece)?\s*#?\s*(\d+))[:\s]*([^\n]+?)(?:\n|$)(.*?)(?=(?:Content\s*(?:Piece)?\s*#?\s*\d+)|$)'
-
-        matches = list(re.finditer(pattern1, text, re.DOTALL | re.IGNORECASE))
+        blocks = list(_iter_blocks(_RE_PIECE_HEAD, _RE_PIECE_BOUNDARY, text))
 
-        if matches:
+        if blocks:
             # Successfully found structured content
-            for match in matches:
+            for head, details in blocks:
                 try:
-                    content_id = int(match.group(1))
-                    title = match.group(2).strip(' :-*"')
-                    details = match.group(3)
-
-                    piece = self._parse_content_details(content_id, title, details)
-                    if piece:
-                        pieces.append(piece)
-                except (ValueError, AttributeError) as e:
+                    content_id = int(head.group(1))
+                except ValueError:
                     # Skip malformed entries
                     continue
+
+                title = head.group(2).strip(' :-*"')
+                pieces.append(self._parse_content_details(content_id, title, details))
         else:
             # Fallback: try to extract from any numbered list
             # Pattern 2: Simple numbered list "1. Title" or "1) Title"
-            pattern2 = r'(?:^|\n)\s*(\d+)[\.\)]\s*([^\n]+)'
-
-            list_matches = list(re.finditer(pattern2, text, re.MULTILINE))
+            list_matches = list(_RE_NUMBERED_ITEM.finditer(text))
 
             for match in list_matches:
                 try:
                     content_id = int(match.group(1))
-                    title = match.group(2).strip()
-
-                    # Create basic piece structure
-                    piece = {
-                        "content_id": content_id,
-                        "title": title,
-                        "week": (content_id - 1) // 5 + 1,
-                        "suggested_date": "",
-                        "channel": "",
-                        "format": "",
-                        "pillar": "",
-                        "key_message": "",
-                        "description": "",
-                        "call_to_action": "",
-                        "effort_level": "Medium",
-                        "effort_explanation": "",
-                        "engagement_potential": "Medium",
-                        "engagement_reasoning": "",
-                        "seo_keyword": "",
-                        "execution_notes": ""
-                    }
-                    pieces.append(piece)
-                except (ValueError, AttributeError):
+                except ValueError:
                     continue
 
+                # Create basic piece structure
+                pieces.append(_new_piece(content_id, match.group(2).strip()))
+
         return pieces
 
     def _parse_content_details(self, content_id: int, title: str, details_text: str) -> Dict:
         """Parse details for a single content piece"""
-        piece = {
-            "content_id": content_id,
-            "title": title,
-            "week": (content_id - 1) // 5 + 1,
-            "suggested_date": "",
-            "channel": "",
-            "format": "",
-            "pillar": "",
-            "key_message": "",
-            "description": "",
-            "call_to_action": "",
-            "effort_level": "Medium",
-            "effort_explanation": "",
-            "engagement_potential": "Medium",
-            "engagement_reasoning": "",
-            "seo_keyword": "",
-            "execution_notes": ""
-        }
+        piece = _new_piece(content_id, title)
 
-        # Extract each field using regex with try/except
-        fields_to_extract = {
-            'week': r'Week[:\s]+(\d+)',
-            'suggested_date': r'(?:Date|Suggested Date)[:\s]+([^\n]+)',
-            'channel': r'Channel[:\s]+([^\n]+)',
-            'format': r'Format[:\s]+([^\n]+)',
-            'pillar': r'Pillar[:\s]+([^\n]+)',
-            'key_message': r'Key Message[:\s]+([^\n]+)',
-            'description': r'Description[:\s]+([^\n]+(?:\n(?![\w\s]*:)[^\n]+)*)',
-            'call_to_action': r'(?:Call to Action|CTA)[:\s]+([^\n]+)',
-            'effort_level': r'Effort(?:\s+Level)?[:\s]+([^\n]+)',
-            'effort_explanation': r'Effort Explanation[:\s]+([^\n]+)',
-            'engagement_potential': r'Engagement(?:\s+Potential)?[:\s]+([^\n]+)',
-            'engagement_reasoning': r'Engagement Reasoning[:\s]+([^\n]+)',
-            'seo_keyword': r'SEO Keyword[:\s]+([^\n]+)',
-            'execution_notes': r'Execution Notes[:\s]+([^\n]+(?:\n(?![\w\s]*:)[^\n]+)*)'
-        }
+        # One pass over the lines; "Label: value" segments (also "|"-separated
+        # on one line) are dispatched through _FIELD_KEYS, first occurrence wins
+        found: Dict[str, List[str]] = {}
+        current = None
 
-        for field, pattern in fields_to_extract.items():
-            try:
-                match = re.search(pattern, details_text, re.IGNORECASE)
-                if match:
-                    value = match.group(1).strip(' -•\n"\'')
-                    if value:  # Only update if non-empty
-                        piece[field] = value
-            except (IndexError, AttributeError):
-                # Keep default value if extraction fails
+        for line in details_text.splitlines():
+            if current is not None:
+                if line and not _is_label_line(line):
+                    found[current].append(line)
+                    continue
+                current = None
+
+            # Prose lines carry no "Label:" and no colon-less "Week N"
+            if ':' not in line and 'week' not in line.lower():
+                continue
+
+            segments = line.split('|')
+            for position, segment in enumerate(segments, 1):
+                label, sep, value = segment.partition(':')
+                key = label.strip(_LABEL_STRIP).lower()
+
+                # "Week 2" is written without a colon
+                if not sep:
+                    if not key.startswith('week'):
+                        continue
+                    key, value = 'week', key[4:]
+
+                field = _FIELD_KEYS.get(key)
+                if field is None or field in found:
+                    continue
+
+                found[field] = [value]
+                if field in _MULTILINE_FIELDS and position == len(segments):
+                    current = field
+
+        for field, parts in found.items():
+            value = '\n'.join(parts).strip(_VALUE_STRIP)
+            if field == 'week':
+                # Week numbers are ints, like the default week
+                value = value.lstrip(': ')
+                digits = len(value) - len(value.lstrip('0123456789'))
+                if digits:
+                    piece['week'] = int(value[:digits])
                 continue
+            if value:  # Only update if non-empty
+                piece[field] = value
 
         return piece
 
@@ -202,76 +513,82 @@ def parse_strategies_output(strategies_text: str) -> List[Dict]:
     strategies = []
 
     # Match strategy blocks (Strategy 1:, Strategy 2:, etc.)
-    pattern = r'(?:Strategy\s+#?\s*(\d+)[:\s]*[^\n]*\n)(.*?)(?=(?:Strategy\s+#?\s*\d+)|(?:RECOMMENDATION|## RECOMMENDATION)|$)'
-
-    matches = re.finditer(pattern, strategies_text, re.DOTALL | re.IGNORECASE)
-
-    for match in matches:
-        strategy_num = int(match.group(1))
-        strategy_text = match.group(2)
-
-        strategy = {
-            "strategy_number": strategy_num,
-            "name": "",
-            "tagline": "",
-            "core_approach": "",
-            "content_pillars": [],
-            "posting_frequency": {},
-            "content_mix": {},
-            "top_5_ideas": [],
-            "pros": [],
-            "cons": []
-        }
+    for head, strategy_text in _iter_blocks(_RE_STRATEGY_HEAD, _RE_STRATEGY_BOUNDARY, strategies_text):
+        strategy = _new_strategy(int(head.group(1)))
+
+        # Extract name, tagline, core approach and pillars (first occurrence of each)
+        fields: Dict[str, str] = {}
+        for match in _RE_STRATEGY_FIELDS.finditer(strategy_text):
+            fields.setdefault(match.lastgroup, match.group(match.lastgroup))
+            if len(fields) == 4:
+                break
+
+        if 'name' in fields:
+            strategy['name'] = fields['name'].strip(' "*')
+        else:
+            # "**Strategy 2: Community Building**" / "Strategy 2 - ..." headers
+            # carry the name (but not prose like "Strategy 2 is best")
+            sep = strategies_text[head.end(1):head.start(2)]
+            head_name = head.group(2)
+            if '\n' not in sep and (':' in sep or head_name[:1] in ('-', '–')):
+                strategy['name'] = head_name.strip(' "*:#-–')
+
+        if 'tagline' in fields:
+            strategy['tagline'] = fields['tagline'].strip(' "*')
 
-        # Extract name/tagline
-        name_match = re.search(r'(?:Name|Strategy Name)[:\s]+([^\n]+)', strategy_text, re.IGNORECASE)
-        if name_match:
-            strategy['name'] = name_match.group(1).strip(' "*')
-
-        tagline_match = re.search(r'Tagline[:\s]+([^\n]+)', strategy_text, re.IGNORECASE)
-        if tagline_match:
-            strategy['tagline'] = tagline_match.group(1).strip(' "*')
-
-        # Extract core approach
-        approach_match = re.search(r'(?:Core Approach|Approach)[:\s]+([^\n]+(?:\n(?![\w\s]*:)[^\n]+)*)',
-                                  strategy_text, re.IGNORECASE)
-        if approach_match:
-            strategy['core_approach'] = approach_match.group(1).strip()
-
-        # Extract content pillars
-        pillars_match = re.search(r'Content Pillars[:\s]+(.*?)(?=\n\*\*[A-Z]|\nPosting|$)',
-                                 strategy_text, re.DOTALL | re.IGNORECASE)
-        if pillars_match:
-            pillars_text = pillars_match.group(1)
-            pillar_items = re.findall(r'[-•]\s*([^:\n]+):\s*([^\n]+)', pillars_text)
+        if 'core_approach' in fields:
+            strategy['core_approach'] = fields['core_approach'].strip()
+
+        if 'content_pillars' in fields:
+            pillar_items = _RE_PILLAR_PAIR.findall(fields['content_pillars'])
             for name, desc in pillar_items:
                 strategy['content_pillars'].append({
                     "name": name.strip(),
                     "description": desc.strip()
                 })
 
-        # Extract top 5 ideas
-        ideas_match = re.search(r'(?:Top 5 Content Ideas|Content Ideas)[:\s]+(.*?)(?=\n\*\*[A-Z]|\nEstimated|$)',
-                               strategy_text, re.DOTALL | re.IGNORECASE)
-        if ideas_match:
-            ideas_text = ideas_match.group(1)
-            ideas = re.findall(r'(?:\d+\.|[-•])\s*([^\n]+)', ideas_text)
+        lines = strategy_text.splitlines()
+
+        # Extract top ideas ("1. Idea", "- Idea" or "• Idea" lines)
+        ideas_lines = _section_lines(lines, _RE_IDEAS_LABEL, ('estimated',))
+        if ideas_lines:
+            ideas = []
+            for line in ideas_lines:
+                line = line.strip()
+                if line[:1] in ('-', '•'):
+                    ideas.append(line[1:])
+                elif line[:1].isdigit():
+                    number = line.lstrip('0123456789')
+                    if number[:1] == '.':
+                        ideas.append(number[1:])
             strategy['top_5_ideas'] = [idea.strip(' "') for idea in ideas if idea.strip()]
 
         # Extract pros
-        pros_match = re.search(r'Pros[:\s]+(.*?)(?=\nCons|\n\*\*[A-Z]|$)',
-                              strategy_text, re.DOTALL | re.IGNORECASE)
-        if pros_match:
-            pros_text = pros_match.group(1)
-            strategy['pros'] = [p.strip(' -•\n') for p in pros_text.split('\n') if p.strip() and not p.strip().startswith('*')]
+        pros_lines = _section_lines(lines, ('pros',), ('cons',))
+        if pros_lines:
+            strategy['pros'] = _bullet_items(pros_lines, skip_bold=True)
 
         # Extract cons
-        cons_match = re.search(r'Cons[:\s]+(.*?)(?=\n\*\*[A-Z]|$)',
-                              strategy_text, re.DOTALL | re.IGNORECASE)
-        if cons_match:
-            cons_text = cons_match.group(1)
-            strategy['cons'] = [c.strip(' -•\n') for c in cons_text.split('\n') if c.strip() and not c.strip().startswith('*')]
+        cons_lines = _section_lines(lines, ('cons',))
+        if cons_lines:
+            strategy['cons'] = _bullet_items(cons_lines, skip_bold=True)
 
         strategies.append(strategy)
 
     return strategies
+
+
+def extract_strategy_text(strategies_text: str, strategy_number: int) -> Optional[str]:
+    """
+    Raw text of one strategy from Strategy Architect output
+
+    Returns:
+        The strategy's header line and body (without the markdown left over
+        from slicing between headers), or None if it isn't found
+    """
+    for head, strategy_text in _iter_blocks(_RE_STRATEGY_HEAD, _RE_STRATEGY_BOUNDARY, strategies_text):
+        if int(head.group(1)) == strategy_number:
+            header = head.group(0).strip(' \n*#')
+            body = strategy_text.rstrip(' \n*#-').strip()
+            return f"{header}\n{body}"
+    return None
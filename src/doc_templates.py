@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Placeholder-patched document scaffolds
+Mock DOCX/XLSX documents only differ by a few fields (brand, month, ...), so
+they are built once with placeholder tokens and later runs copy the cached
+scaffold, substituting the tokens directly in the zipped XML
+"""
+
+import glob
+import hashlib
+import os
+import tempfile
+import zipfile
+from datetime import date
+from typing import Callable, Dict, Iterable
+from xml.sax.saxutils import escape
+
+TEMPLATE_DIR = os.getenv("DOC_TEMPLATE_DIR", ".doc_templates")
+
+
+def placeholder(field: str) -> str:
+    """Token written into the scaffold for a field"""
+    return "{{" + field + "}}"
+
+
+def _template_path(name: str, fields: Iterable[str], sources: Iterable[str]) -> str:
+    """
+    Cache path for a scaffold
+
+    The key covers the field names, today's date (generators stamp the
+    creation date into the document) and the modification time of every
+    source file that shapes the document, so edits rebuild the scaffold.
+    """
+    key = hashlib.sha256()
+    key.update(name.encode("utf-8"))
+    key.update(",".join(sorted(fields)).encode("utf-8"))
+    key.update(date.today().isoformat().encode("utf-8"))
+    for source in sources:
+        key.update(f"{source}:{os.path.getmtime(source)}".encode("utf-8"))
+
+    stem, ext = os.path.splitext(name)
+    return os.path.join(TEMPLATE_DIR, f"{stem}-{key.hexdigest()[:16]}{ext}")
+
+
+def _build_template(path: str, build: Callable[[Dict[str, str], str], object], fields: Iterable[str]) -> None:
+    """Render the scaffold with placeholder tokens and move it into the cache"""
+    os.makedirs(TEMPLATE_DIR, exist_ok=True)
+    ext = os.path.splitext(path)[1]
+
+    fd, tmp_path = tempfile.mkstemp(suffix=ext, dir=TEMPLATE_DIR)
+    os.close(fd)
+    try:
+        build({field: placeholder(field) for field in fields}, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _patch(template_path: str, output_path: str, values: Dict[str, str]) -> None:
+    """Copy the scaffold to output_path, substituting tokens in every XML part"""
+    replacements = [
+        (placeholder(field).encode("utf-8"), escape(str(value)).encode("utf-8"))
+        for field, value in values.items()
+    ]
+
+    with zipfile.ZipFile(template_path) as src, \
+            zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename.endswith(".xml"):
+                for token, value in replacements:
+                    data = data.replace(token, value)
+            dst.writestr(info, data)
+
+
+def render_from_template(
+    name: str,
+    build: Callable[[Dict[str, str], str], object],
+    values: Dict[str, str],
+    output_path: str,
+    sources: Iterable[str] = ()
+) -> str:
+    """
+    Write a document by patching a cached placeholder scaffold
+
+    Args:
+        name: Scaffold file name (extension selects the format)
+        build: Called as build(placeholders, path) to render the scaffold;
+            placeholders maps each field to its token
+        values: Field values for this document
+        output_path: Where to save the file
+        sources: Files whose changes should invalidate the scaffold
+
+    Returns:
+        output_path
+    """
+    sources = tuple(sources)
+    template_path = _template_path(name, values, sources)
+
+    if not os.path.exists(template_path):
+        _build_template(template_path, build, values)
+
+        # Drop scaffolds from earlier days or older generator versions
+        stem, ext = os.path.splitext(name)
+        for stale in glob.glob(os.path.join(TEMPLATE_DIR, f"{stem}-*{ext}")):
+            if stale != template_path:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    _patch(template_path, output_path, values)
+    return output_path
@@ -2,13 +2,109 @@ from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from datetime import datetime
+import copy
+import functools
+import io
 import os
 
+# Shared colors and font sizes (immutable values, reused by every run)
+_BLUE = RGBColor(74, 144, 226)
+_GREY = RGBColor(128, 128, 128)
+_DARKGREY = RGBColor(100, 100, 100)
+_GREEN = RGBColor(0, 128, 0)
+_RED = RGBColor(255, 69, 0)
+_PT_11 = Pt(11)
+_PT_12 = Pt(12)
+_PT_14 = Pt(14)
+_PT_16 = Pt(16)
+
+# Title page rule line
+_DIVIDER = '_' * 60
+
+# Template placeholders the LLM sometimes echoes back instead of real content
+_EMPTY_DESC = frozenset({'Content description', 'Engaging content', 'Description'})
+_EMPTY_MSG = frozenset({'Key message', 'Main message'})
+_EMPTY_NOTES = frozenset({'Execution notes', 'Tips for creating content piece', 'Notes'})
+
+
+@functools.cache
+def _template_document():
+    """Blank Document parsed from python-docx's bundled default.docx"""
+    return Document()
+
+
+def _new_document():
+    """
+    Fresh blank Document
+
+    Deep-copies a template parsed once per process instead of re-reading and
+    re-parsing default.docx for every generator (~3x cheaper).
+    """
+    return copy.deepcopy(_template_document())
+
+
+def _add_paragraph(doc, style_ids, text, style):
+    """
+    doc.add_paragraph(text, style=style) with the style id resolved once
+
+    python-docx resolves a style name on every call by scanning all styles
+    in the document, which dominates building a strategy section; the id is
+    cached in style_ids (one dict per document) instead.
+    """
+    style_id = style_ids.get(style)
+    if style_id is None:
+        style_id = style_ids[style] = doc.styles[style].style_id
+
+    paragraph = doc.add_paragraph(text)
+    paragraph._p.style = style_id
+    return paragraph
+
+
+def _add_heading(doc, style_ids, text, level):
+    """doc.add_heading(text, level) through the cached style ids"""
+    return _add_paragraph(doc, style_ids, text, 'Title' if level == 0 else f'Heading {level}')
+
+
+def _fast_para(body, fields=(), italic=False, color=None, line_breaks=False):
+    """
+    Append a "Label: value" paragraph straight to the document body XML
+
+    Skips python-docx's Paragraph/Run proxies and their style lookups, which
+    dominate when writing dozens of content pieces; the XML matches
+    add_paragraph() + add_run().
+
+    Args:
+        body: Document body element (doc.element.body)
+        fields: (label, value) pairs; labels are bold
+        italic: Italicize the values
+        color: RGBColor for the values
+        line_breaks: Put each pair on its own line within the paragraph
+    """
+    p = body.add_p()
+    last = len(fields) - 1
+    for idx, (label, value) in enumerate(fields):
+        label_run = p.add_r()
+        label_run.get_or_add_rPr().get_or_add_b().val = True
+        label_run.text = label
+
+        value = str(value)
+        value_run = p.add_r()
+        if italic:
+            value_run.get_or_add_rPr().get_or_add_i().val = True
+        if color is not None:
+            value_run.get_or_add_rPr().get_or_add_color().val = color
+        if value:
+            value_run.text = value
+        if line_breaks and idx < last:
+            value_run.add_br()
+    return p
+
 class StrategyDocumentGenerator:
     """Generate professional DOCX documents for content strategies"""
 
     def __init__(self):
-        self.doc = Document()
+        self.doc = _new_document()
+        self._style_ids = {}
         self.setup_styles()
 
     def setup_styles(self):
@@ -17,7 +113,7 @@ class StrategyDocumentGenerator:
         style = self.doc.styles['Normal']
         font = style.font
         font.name = 'Arial'
-        font.size = Pt(11)
+        font.size = _PT_11
 
     def add_title_page(self, brand_name, strategy_count=5):
         """Add professional title page"""
@@ -29,35 +125,35 @@ class StrategyDocumentGenerator:
         subtitle = self.doc.add_paragraph()
         subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = subtitle.add_run(f'{strategy_count} Strategic Approaches for {brand_name}')
-        run.font.size = Pt(16)
-        run.font.color.rgb = RGBColor(74, 144, 226)  # Blue
+        run.font.size = _PT_16
+        run.font.color.rgb = _BLUE
 
         # Date
         date_para = self.doc.add_paragraph()
         date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         date_run = date_para.add_run(f'Generated: {datetime.now().strftime("%B %d, %Y")}')
-        date_run.font.size = Pt(12)
-        date_run.font.color.rgb = RGBColor(128, 128, 128)  # Gray
+        date_run.font.size = _PT_12
+        date_run.font.color.rgb = _GREY
 
         # Add some space
         self.doc.add_paragraph()
         self.doc.add_paragraph()
 
         # Divider
-        self.doc.add_paragraph('_' * 60)
+        self.doc.add_paragraph(_DIVIDER)
 
         # Page break
         self.doc.add_page_break()
 
     def add_section(self, title, content, level=1):
         """Add a section with heading and content"""
-        self.doc.add_heading(title, level=level)
+        _add_heading(self.doc, self._style_ids, title, level)
 
         if isinstance(content, str):
             self.doc.add_paragraph(content)
         elif isinstance(content, list):
             for item in content:
-                self.doc.add_paragraph(item, style='List Bullet')
+                _add_paragraph(self.doc, self._style_ids, item, 'List Bullet')
         elif isinstance(content, dict):
             for key, value in content.items():
                 p = self.doc.add_paragraph()
@@ -67,88 +163,88 @@ class StrategyDocumentGenerator:
     def add_strategy(self, strategy_num, strategy_data):
         """Add a complete strategy section"""
         # Strategy header
-        self.doc.add_heading(f'Strategy {strategy_num}: {strategy_data.get("name", "Unnamed Strategy")}', level=1)
+        _add_heading(self.doc, self._style_ids, f'Strategy {strategy_num}: {strategy_data.get("name", "Unnamed Strategy")}', 1)
 
         # Tagline
         if 'tagline' in strategy_data:
             tagline = self.doc.add_paragraph()
             tagline_run = tagline.add_run(f'"{strategy_data["tagline"]}"')
             tagline_run.italic = True
-            tagline_run.font.size = Pt(12)
-            tagline_run.font.color.rgb = RGBColor(74, 144, 226)
+            tagline_run.font.size = _PT_12
+            tagline_run.font.color.rgb = _BLUE
 
         self.doc.add_paragraph()  # Space
 
         # Core approach
         if 'core_approach' in strategy_data:
-            self.doc.add_heading('Core Approach', level=2)
+            _add_heading(self.doc, self._style_ids, 'Core Approach', 2)
             self.doc.add_paragraph(strategy_data['core_approach'])
 
         # Content Pillars
         if 'content_pillars' in strategy_data:
-            self.doc.add_heading('Content Pillars', level=2)
+            _add_heading(self.doc, self._style_ids, 'Content Pillars', 2)
             pillars = strategy_data['content_pillars']
             if isinstance(pillars, list):
                 for pillar in pillars:
                     if isinstance(pillar, dict):
-                        p = self.doc.add_paragraph(style='List Bullet')
+                        p = _add_paragraph(self.doc, self._style_ids, '', 'List Bullet')
                         p.add_run(f"{pillar.get('name', 'Unnamed Pillar')}: ").bold = True
                         p.add_run(pillar.get('description', ''))
                     else:
-                        self.doc.add_paragraph(str(pillar), style='List Bullet')
+                        _add_paragraph(self.doc, self._style_ids, str(pillar), 'List Bullet')
 
         # Posting Frequency
         if 'posting_frequency' in strategy_data:
-            self.doc.add_heading('Posting Frequency', level=2)
+            _add_heading(self.doc, self._style_ids, 'Posting Frequency', 2)
             freq = strategy_data['posting_frequency']
             if isinstance(freq, dict):
                 for channel, count in freq.items():
-                    self.doc.add_paragraph(f'{channel}: {count}', style='List Bullet')
+                    _add_paragraph(self.doc, self._style_ids, f'{channel}: {count}', 'List Bullet')
             else:
                 self.doc.add_paragraph(str(freq))
 
         # Content Mix
         if 'content_mix' in strategy_data:
-            self.doc.add_heading('Content Mix', level=2)
+            _add_heading(self.doc, self._style_ids, 'Content Mix', 2)
             mix = strategy_data['content_mix']
             if isinstance(mix, dict):
                 for content_type, percentage in mix.items():
-                    self.doc.add_paragraph(f'{content_type}: {percentage}%', style='List Bullet')
+                    _add_paragraph(self.doc, self._style_ids, f'{content_type}: {percentage}%', 'List Bullet')
 
         # Top Content Ideas
         if 'top_5_ideas' in strategy_data:
-            self.doc.add_heading('Top 5 Content Ideas', level=2)
+            _add_heading(self.doc, self._style_ids, 'Top 5 Content Ideas', 2)
             for i, idea in enumerate(strategy_data['top_5_ideas'], 1):
-                self.doc.add_paragraph(f'{i}. {idea}', style='List Number')
+                _add_paragraph(self.doc, self._style_ids, f'{i}. {idea}', 'List Number')
 
         # Expected Results
         if 'expected_results' in strategy_data:
-            self.doc.add_heading('Expected 30-Day Results', level=2)
+            _add_heading(self.doc, self._style_ids, 'Expected 30-Day Results', 2)
             results = strategy_data['expected_results']
             if isinstance(results, list):
                 for result in results:
-                    self.doc.add_paragraph(result, style='List Bullet')
+                    _add_paragraph(self.doc, self._style_ids, result, 'List Bullet')
             else:
                 self.doc.add_paragraph(str(results))
 
         # Pros and Cons
-        self.doc.add_heading('Pros & Cons', level=2)
+        _add_heading(self.doc, self._style_ids, 'Pros & Cons', 2)
 
         if 'pros' in strategy_data:
             self.doc.add_paragraph().add_run('Pros:').bold = True
             pros = strategy_data['pros']
             if isinstance(pros, list):
                 for pro in pros:
-                    p = self.doc.add_paragraph(pro, style='List Bullet')
-                    p.runs[0].font.color.rgb = RGBColor(0, 128, 0)  # Green
+                    p = _add_paragraph(self.doc, self._style_ids, pro, 'List Bullet')
+                    p.runs[0].font.color.rgb = _GREEN
 
         if 'cons' in strategy_data:
             self.doc.add_paragraph().add_run('Cons:').bold = True
             cons = strategy_data['cons']
             if isinstance(cons, list):
                 for con in cons:
-                    p = self.doc.add_paragraph(con, style='List Bullet')
-                    p.runs[0].font.color.rgb = RGBColor(255, 69, 0)  # Red
+                    p = _add_paragraph(self.doc, self._style_ids, con, 'List Bullet')
+                    p.runs[0].font.color.rgb = _RED
 
         # Page break after each strategy
         self.doc.add_page_break()
@@ -160,13 +256,16 @@ class StrategyDocumentGenerator:
         # Highlight box effect with paragraph
         rec_para = self.doc.add_paragraph()
         rec_run = rec_para.add_run('💡 ' + recommendation_text)
-        rec_run.font.size = Pt(12)
+        rec_run.font.size = _PT_12
 
         self.doc.add_paragraph()  # Space
 
     def save(self, filepath):
-        """Save the document"""
-        self.doc.save(filepath)
+        """Save the document (built in memory, then written with a single write)"""
+        buf = io.BytesIO()
+        self.doc.save(buf)
+        with open(filepath, 'wb', buffering=1024 * 1024) as f:
+            f.write(buf.getvalue())
         return filepath
 
 
@@ -174,7 +273,8 @@ class CalendarDocumentGenerator:
     """Generate professional DOCX documents for content calendars"""
 
     def __init__(self):
-        self.doc = Document()
+        self.doc = _new_document()
+        self._style_ids = {}
         self.setup_styles()
 
     def setup_styles(self):
@@ -182,7 +282,7 @@ class CalendarDocumentGenerator:
         style = self.doc.styles['Normal']
         font = style.font
         font.name = 'Arial'
-        font.size = Pt(11)
+        font.size = _PT_11
 
     def add_title_page(self, brand_name, strategy_name, month):
         """Add title page for calendar"""
@@ -192,15 +292,15 @@ class CalendarDocumentGenerator:
         subtitle = self.doc.add_paragraph()
         subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = subtitle.add_run(f'{brand_name} • {strategy_name}')
-        run.font.size = Pt(16)
-        run.font.color.rgb = RGBColor(74, 144, 226)
+        run.font.size = _PT_16
+        run.font.color.rgb = _BLUE
 
         month_para = self.doc.add_paragraph()
         month_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         month_run = month_para.add_run(month)
-        month_run.font.size = Pt(14)
+        month_run.font.size = _PT_14
 
-        self.doc.add_paragraph('_' * 60)
+        self.doc.add_paragraph(_DIVIDER)
         self.doc.add_page_break()
 
     def add_executive_summary(self, summary):
@@ -211,81 +311,77 @@ class CalendarDocumentGenerator:
 
     def add_content_piece(self, piece_data, brand_name=''):
         """Add a single content piece"""
+        get = piece_data.get
+        title = get('title', 'Untitled')
+        week = get('week', 'TBD')
+        date = get('suggested_date', 'TBD')
+        channel = get('channel', 'TBD')
+        format_type = get('format', 'TBD')
+        pillar = get('pillar', 'TBD')
+        description = get('description', '')
+        key_message = get('key_message', '')
+        cta = get('call_to_action', 'Take action')
+        effort = get('effort_level', 'Medium')
+        engagement = get('engagement_potential', 'Medium')
+        exec_notes = get('execution_notes', '')
+
         # Content header
-        header = self.doc.add_heading(
-            f"Content #{piece_data.get('content_id', '?')}: {piece_data.get('title', 'Untitled')}",
-            level=2
-        )
-
-        # Details table-like format
-        details = [
-            ('Week', piece_data.get('week', 'TBD')),
-            ('Date', piece_data.get('suggested_date', 'TBD')),
-            ('Channel', piece_data.get('channel', 'TBD')),
-            ('Format', piece_data.get('format', 'TBD')),
-            ('Pillar', piece_data.get('pillar', 'TBD')),
-        ]
-
-        for label, value in details:
-            p = self.doc.add_paragraph()
-            p.add_run(f'{label}: ').bold = True
-            p.add_run(str(value))
+        _add_heading(self.doc, self._style_ids, f"Content #{get('content_id', '?')}: {title}", 2)
 
-        self.doc.add_paragraph()  # Space
+        body = self.doc.element.body
+
+        # Details block: one paragraph, one line per detail
+        _fast_para(body, [
+            ('Week: ', week),
+            ('Date: ', date),
+            ('Channel: ', channel),
+            ('Format: ', format_type),
+            ('Pillar: ', pillar),
+        ], line_breaks=True)
+
+        _fast_para(body)  # Space
 
         # Description - ENSURE IT'S NOT EMPTY
-        description = piece_data.get('description', '')
-        if not description or description in ['Content description', 'Engaging content', 'Description']:
-            title = piece_data.get('title', 'this topic')
-            format_type = piece_data.get('format', 'engaging content')
-            description = f"Detailed content about {title} for {brand_name}. This piece will provide value to the audience through {format_type}."
+        if not description or description in _EMPTY_DESC:
+            topic = title if 'title' in piece_data else 'this topic'
+            medium = format_type if 'format' in piece_data else 'engaging content'
+            description = f"Detailed content about {topic} for {brand_name}. This piece will provide value to the audience through {medium}."
 
-        desc_para = self.doc.add_paragraph()
-        desc_para.add_run('Description: ').bold = True
-        desc_para.add_run(description)
+        _fast_para(body, [('Description: ', description)])
 
         # Key Message - ENSURE IT'S NOT EMPTY
-        key_message = piece_data.get('key_message', '')
-        if not key_message or key_message in ['Key message', 'Main message']:
-            pillar = piece_data.get('pillar', 'brand values')
-            key_message = f"Main message highlighting {brand_name}'s value proposition related to {pillar}."
+        if not key_message or key_message in _EMPTY_MSG:
+            theme = pillar if 'pillar' in piece_data else 'brand values'
+            key_message = f"Main message highlighting {brand_name}'s value proposition related to {theme}."
 
-        msg_para = self.doc.add_paragraph()
-        msg_para.add_run('Key Message: ').bold = True
-        msg_para.add_run(key_message)
+        _fast_para(body, [('Key Message: ', key_message)])
 
         # Call to Action
-        cta = piece_data.get('call_to_action', 'Take action')
-        cta_para = self.doc.add_paragraph()
-        cta_para.add_run('Call to Action: ').bold = True
-        cta_para.add_run(cta)
+        _fast_para(body, [('Call to Action: ', cta)])
 
         # Effort and Engagement
-        meta = self.doc.add_paragraph()
-        meta.add_run('Effort: ').bold = True
-        meta.add_run(f"{piece_data.get('effort_level', 'Medium')} • ")
-        meta.add_run('Engagement Potential: ').bold = True
-        meta.add_run(piece_data.get('engagement_potential', 'Medium'))
+        _fast_para(body, [
+            ('Effort: ', f"{effort} • "),
+            ('Engagement Potential: ', engagement)
+        ])
 
         # Execution Notes - ENSURE IT'S NOT EMPTY
-        exec_notes = piece_data.get('execution_notes', '')
-        if not exec_notes or exec_notes in ['Execution notes', 'Tips for creating content piece', 'Notes']:
-            format_type = piece_data.get('format', 'content')
-            channel = piece_data.get('channel', 'the platform')
-            effort = piece_data.get('effort_level', 'medium')
-            exec_notes = f"Production tips: Plan {format_type} creation for {channel}. Consider {effort} effort level when scheduling production."
+        if not exec_notes or exec_notes in _EMPTY_NOTES:
+            medium = format_type if 'format' in piece_data else 'content'
+            platform = channel if 'channel' in piece_data else 'the platform'
+            level = effort if 'effort_level' in piece_data else 'medium'
+            exec_notes = f"Production tips: Plan {medium} creation for {platform}. Consider {level} effort level when scheduling production."
 
-        notes_para = self.doc.add_paragraph()
-        notes_para.add_run('Execution Notes: ').bold = True
-        notes_run = notes_para.add_run(exec_notes)
-        notes_run.font.italic = True
-        notes_run.font.color.rgb = RGBColor(100, 100, 100)
+        _fast_para(body, [('Execution Notes: ', exec_notes)], italic=True, color=_DARKGREY)
 
-        self.doc.add_paragraph()  # Space between pieces
+        _fast_para(body)  # Space between pieces
 
     def save(self, filepath):
-        """Save the document"""
-        self.doc.save(filepath)
+        """Save the document (built in memory, then written with a single write)"""
+        buf = io.BytesIO()
+        self.doc.save(buf)
+        with open(filepath, 'wb', buffering=1024 * 1024) as f:
+            f.write(buf.getvalue())
         return filepath
 
 
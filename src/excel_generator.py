@@ -1,17 +1,64 @@
 # -*- coding: utf-8 -*-
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
+from copy import copy
 from datetime import datetime
+import functools
+import io
+import re
+
+try:
+    import xlsxwriter  # optional: streaming writer, used by default when installed
+except ImportError:
+    xlsxwriter = None
+
+# "Pillar N" (any case) for pillar color coding
+_PILLAR_RE = re.compile(r'pillar ([1-4])', re.IGNORECASE)
+
+# "(Monday)" part of a date like "January 15, 2025 (Monday)"
+_PAREN_RE = re.compile(r'\(([^)]+)\)')
+
+# Column widths per tab, applied before the first row is written
+_MONTHLY_WIDTHS = {'A': 15, 'B': 12, 'C': 40, 'D': 12, 'E': 15, 'F': 20, 'G': 12, 'H': 30}
+_DETAILS_WIDTHS = {
+    get_column_letter(idx): width
+    for idx, width in enumerate([5, 6, 30, 15, 12, 15, 25, 35, 20, 10, 12, 20, 30], start=1)
+}
+_CHECKLIST_WIDTHS = {'A': 10, 'B': 12, 'C': 40, 'D': 15, 'E': 30}
+_METRICS_WIDTHS = {'A': 12, 'B': 40, 'C': 12, 'D': 15, 'E': 12, 'F': 15, 'G': 30}
+
+
+@functools.lru_cache(maxsize=64)
+def _day_of_week(date_string):
+    """Text inside the first parentheses of date_string, or ''
+
+    e.g. "January 15, 2025 (Monday)" -> "Monday"
+    """
+    match = _PAREN_RE.search(date_string)
+    return match.group(1) if match else ''
+
+
+@functools.lru_cache(maxsize=64)
+def _pillar_number(pillar_text):
+    """Lowest pillar number (1-4) mentioned in pillar_text, or None"""
+    numbers = _PILLAR_RE.findall(pillar_text)
+    return int(min(numbers)) if numbers else None
+
+
+def _week_of(piece):
+    """Week number of a content piece (defaults to week 1)"""
+    return piece.get('week', 1)
+
 
 class ContentCalendarExcelGenerator:
     """Generate professional Excel content calendars"""
 
     def __init__(self):
-        self.wb = Workbook()
-        # Remove default sheet
-        if 'Sheet' in self.wb.sheetnames:
-            self.wb.remove(self.wb['Sheet'])
+        # Write-only workbook: rows are streamed to the file as they are
+        # appended, so column widths must be set before a sheet's first row
+        self.wb = Workbook(write_only=True)
 
         # Define colors
         self.colors = {
@@ -22,58 +69,105 @@ class ContentCalendarExcelGenerator:
             'pillar4': 'FFD4D4',  # Light red
         }
 
+        # Shared style objects, reused by every styled cell
+        self._header_fill = PatternFill(start_color=self.colors['header'], end_color=self.colors['header'], fill_type='solid')
+        self._pillar_fills = {
+            num: PatternFill(start_color=self.colors[f'pillar{num}'], end_color=self.colors[f'pillar{num}'], fill_type='solid')
+            for num in range(1, 5)
+        }
+        self._header_font = Font(bold=True, color='000000')
+        self._light_header_font = Font(bold=True, color='FFFFFF')
+        self._bold = Font(bold=True)
+        self._section_font = Font(size=12, bold=True)
+        self._center = Alignment(horizontal='center', vertical='center')
+        self._wrap = Alignment(wrap_text=True, vertical='top')
+        self._pillar_styles = {}
+        self._wrap_style = None
+
+    def _cell(self, ws, value, fill=None, font=None, alignment=None):
+        """Styled cell for a write-only sheet row"""
+        cell = WriteOnlyCell(ws, value=value)
+        if fill is not None:
+            cell.fill = fill
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        return cell
+
+    def _pillar_row(self, ws, values, pillar_num):
+        """
+        Write-only cells for a pillar-colored calendar row
+
+        The fill is resolved against the workbook's style tables once per
+        pillar; every other cell gets a copy of that style array instead of
+        re-hashing the PatternFill on assignment.
+        """
+        style = self._pillar_styles.get(pillar_num)
+        if style is None:
+            styled = WriteOnlyCell(ws)
+            styled.fill = self._pillar_fills[pillar_num]
+            style = self._pillar_styles[pillar_num] = styled._style
+
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = copy(style)
+            cells.append(cell)
+        return cells
+
+    def _wrap_cell(self, ws, value):
+        """Top-aligned wrapping cell, sharing one resolved style like _pillar_row"""
+        if self._wrap_style is None:
+            styled = WriteOnlyCell(ws)
+            styled.alignment = self._wrap
+            self._wrap_style = styled._style
+
+        cell = WriteOnlyCell(ws, value=value)
+        cell._style = copy(self._wrap_style)
+        return cell
+
     def create_monthly_calendar_tab(self, content_pieces, brand_name, month):
         """Create the main monthly calendar view"""
         ws = self.wb.create_sheet("Monthly Calendar")
 
+        for letter, width in _MONTHLY_WIDTHS.items():
+            ws.column_dimensions[letter].width = width
+
         # Title
-        ws['A1'] = f"{brand_name} - Content Calendar"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws['A2'] = month
-        ws['A2'].font = Font(size=12, color='666666')
+        ws.append([self._cell(ws, f"{brand_name} - Content Calendar", font=Font(size=16, bold=True))])
+        ws.append([self._cell(ws, month, font=Font(size=12, color='666666'))])
+        ws.append([])
 
         # Headers
         headers = ['Date', 'Day', 'Content Title', 'Channel', 'Format', 'Pillar', 'Status', 'Notes']
-        header_fill = PatternFill(start_color=self.colors['header'], end_color=self.colors['header'], fill_type='solid')
-        header_font = Font(bold=True, color='000000')
-
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=4, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # Content rows
-        for idx, piece in enumerate(content_pieces, 5):
-            ws.cell(row=idx, column=1, value=piece.get('suggested_date', ''))
-            ws.cell(row=idx, column=2, value=self._get_day_of_week(piece.get('suggested_date', '')))
-            ws.cell(row=idx, column=3, value=piece.get('title', ''))
-            ws.cell(row=idx, column=4, value=piece.get('channel', ''))
-            ws.cell(row=idx, column=5, value=piece.get('format', ''))
-            ws.cell(row=idx, column=6, value=piece.get('pillar', ''))
-            ws.cell(row=idx, column=7, value='Draft')  # Default status
-            ws.cell(row=idx, column=8, value='')  # Empty notes
+
+        ws.append([
+            self._cell(ws, header, fill=self._header_fill, font=self._header_font, alignment=self._center)
+            for header in headers
+        ])
+
+        # Content rows, one append per piece
+        for piece in content_pieces:
+            date = piece.get('suggested_date', '')
+            pillar = piece.get('pillar', '')
+            row = [
+                date,
+                _day_of_week(date),
+                piece.get('title', ''),
+                piece.get('channel', ''),
+                piece.get('format', ''),
+                pillar,
+                'Draft',  # Default status
+                ''  # Empty notes
+            ]
 
             # Color code by pillar
-            pillar_num = self._extract_pillar_number(piece.get('pillar', ''))
+            pillar_num = _pillar_number(pillar)
             if pillar_num:
-                pillar_color = self.colors.get(f'pillar{pillar_num}', 'FFFFFF')
-                for col in range(1, 9):
-                    ws.cell(row=idx, column=col).fill = PatternFill(
-                        start_color=pillar_color,
-                        end_color=pillar_color,
-                        fill_type='solid'
-                    )
-
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 12
-        ws.column_dimensions['C'].width = 40
-        ws.column_dimensions['D'].width = 12
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 20
-        ws.column_dimensions['G'].width = 12
-        ws.column_dimensions['H'].width = 30
+                row = self._pillar_row(ws, row, pillar_num)
+
+            ws.append(row)
 
         return ws
 
@@ -81,6 +175,9 @@ class ContentCalendarExcelGenerator:
         """Create detailed content specifications tab"""
         ws = self.wb.create_sheet("Content Details")
 
+        for letter, width in _DETAILS_WIDTHS.items():
+            ws.column_dimensions[letter].width = width
+
         # Headers for Content Details
         detail_headers = [
             "ID", "Week", "Title", "Pillar", "Channel", "Format",
@@ -88,14 +185,14 @@ class ContentCalendarExcelGenerator:
             "Engagement", "SEO Keyword", "Notes"
         ]
 
-        ws.append(detail_headers)
-
         # Format headers
-        header_fill = PatternFill(start_color=self.colors['header'], end_color=self.colors['header'], fill_type='solid')
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+        ws.append([
+            self._cell(ws, header, fill=self._header_fill, font=self._light_header_font, alignment=self._center)
+            for header in detail_headers
+        ])
+
+        # Wrap text for key message, description, CTA and notes columns
+        wrap = self._wrap_cell
 
         # Add content details data
         for piece in content_pieces:
@@ -106,73 +203,43 @@ class ContentCalendarExcelGenerator:
                 piece.get('pillar', ''),
                 piece.get('channel', ''),
                 piece.get('format', ''),
-                piece.get('key_message', ''),
-                piece.get('description', ''),
-                piece.get('call_to_action', ''),
+                wrap(ws, piece.get('key_message', '')),
+                wrap(ws, piece.get('description', '')),
+                wrap(ws, piece.get('call_to_action', '')),
                 piece.get('effort_level', ''),
                 piece.get('engagement_potential', ''),
                 piece.get('seo_keyword', ''),
-                piece.get('execution_notes', '')
+                wrap(ws, piece.get('execution_notes', ''))
             ]
             ws.append(detail_row)
 
-        # Set column widths for Content Details
-        column_widths_details = [5, 6, 30, 15, 12, 15, 25, 35, 20, 10, 12, 20, 30]
-
-        for idx, width in enumerate(column_widths_details, start=1):
-            column_letter = ws.cell(row=1, column=idx).column_letter
-            ws.column_dimensions[column_letter].width = width
-
-        # Wrap text for description, key message, and notes columns
-        for row_idx in range(2, len(content_pieces) + 2):
-            for col_idx in [7, 8, 9, 13]:  # Key Message, Description, CTA, Notes columns
-                cell = ws.cell(row=row_idx, column=col_idx)
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
-
         return ws
 
     def create_weekly_checklist_tab(self, content_pieces):
         """Create weekly checklist view"""
         ws = self.wb.create_sheet("Weekly Checklist")
 
+        for letter, width in _CHECKLIST_WIDTHS.items():
+            ws.column_dimensions[letter].width = width
+
         checklist_headers = ["Week", "Content ID", "Title", "Status", "Notes"]
-        ws.append(checklist_headers)
 
         # Format headers
-        header_fill = PatternFill(start_color=self.colors['header'], end_color=self.colors['header'], fill_type='solid')
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Group by week
-        weeks = {}
-        for piece in content_pieces:
-            week = piece.get('week', 1)
-            if week not in weeks:
-                weeks[week] = []
-            weeks[week].append(piece)
-
-        # Add checklist data
-        current_row = 2
-        for week in sorted(weeks.keys()):
-            for piece in weeks[week]:
-                checklist_row = [
-                    f"Week {week}",
-                    piece.get('content_id', ''),
-                    piece.get('title', ''),
-                    "Pending",
-                    ""
-                ]
-                ws.append(checklist_row)
-                current_row += 1
-
-        # Set column widths
-        ws.column_dimensions['A'].width = 10
-        ws.column_dimensions['B'].width = 12
-        ws.column_dimensions['C'].width = 40
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 30
+        ws.append([
+            self._cell(ws, header, fill=self._header_fill, font=self._light_header_font, alignment=self._center)
+            for header in checklist_headers
+        ])
+
+        # Add checklist data, grouped by week (stable sort keeps calendar order within a week)
+        for piece in sorted(content_pieces, key=_week_of):
+            checklist_row = [
+                f"Week {_week_of(piece)}",
+                piece.get('content_id', ''),
+                piece.get('title', ''),
+                "Pending",
+                ""
+            ]
+            ws.append(checklist_row)
 
         return ws
 
@@ -180,79 +247,220 @@ class ContentCalendarExcelGenerator:
         """Create metrics tracking tab"""
         ws = self.wb.create_sheet("Metrics Tracker")
 
+        for letter, width in _METRICS_WIDTHS.items():
+            ws.column_dimensions[letter].width = width
+
         # Title
-        ws['A1'] = "Content Performance Metrics"
-        ws['A1'].font = Font(size=14, bold=True)
+        ws.append([self._cell(ws, "Content Performance Metrics", font=Font(size=14, bold=True))])
+        ws.append([])
 
         # Success Metrics section
-        ws['A3'] = "Target Metrics"
-        ws['A3'].font = Font(size=12, bold=True)
+        ws.append([self._cell(ws, "Target Metrics", font=self._section_font)])
 
-        if success_metrics:
-            row = 4
-            for metric in success_metrics:
-                ws.cell(row=row, column=1, value='•')
-                ws.cell(row=row, column=2, value=metric)
-                row += 1
+        for metric in success_metrics or []:
+            ws.append(['•', metric])
 
         # Performance tracking table
-        row = row + 2
-        ws.cell(row=row, column=1, value="Content Performance Tracking")
-        ws.cell(row=row, column=1).font = Font(size=12, bold=True)
-        row += 1
+        ws.append([])
+        ws.append([])
+        ws.append([self._cell(ws, "Content Performance Tracking", font=self._section_font)])
 
         headers = ['Content ID', 'Title', 'Views', 'Engagement', 'Clicks', 'Conversions', 'Notes']
-        header_fill = PatternFill(start_color=self.colors['header'], end_color=self.colors['header'], fill_type='solid')
-
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = Font(bold=True)
-        row += 1
+        ws.append([self._cell(ws, header, fill=self._header_fill, font=self._bold) for header in headers])
 
         # Empty rows for tracking
         for piece in content_pieces:
-            ws.cell(row=row, column=1, value=piece.get('content_id', ''))
-            ws.cell(row=row, column=2, value=piece.get('title', ''))
             # Leave other columns empty for manual tracking
-            row += 1
-
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 40
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 12
-        ws.column_dimensions['F'].width = 15
-        ws.column_dimensions['G'].width = 30
+            ws.append([piece.get('content_id', ''), piece.get('title', '')])
 
         return ws
 
-    def _get_day_of_week(self, date_string):
-        """Extract day of week from date string"""
-        # Simple extraction - assumes format like "January 15, 2025 (Monday)"
-        if '(' in date_string and ')' in date_string:
-            return date_string[date_string.find('(')+1:date_string.find(')')]
-        return ''
-
-    def _extract_pillar_number(self, pillar_text):
-        """Extract pillar number for color coding"""
-        if 'Pillar 1' in pillar_text or 'pillar 1' in pillar_text.lower():
-            return 1
-        elif 'Pillar 2' in pillar_text or 'pillar 2' in pillar_text.lower():
-            return 2
-        elif 'Pillar 3' in pillar_text or 'pillar 3' in pillar_text.lower():
-            return 3
-        elif 'Pillar 4' in pillar_text or 'pillar 4' in pillar_text.lower():
-            return 4
-        return None
-
     def save(self, filepath):
-        """Save the workbook"""
-        self.wb.save(filepath)
+        """Save the workbook (built in memory, then written with a single write)"""
+        buf = io.BytesIO()
+        self.wb.save(buf)
+        with open(filepath, 'wb', buffering=1024 * 1024) as f:
+            f.write(buf.getvalue())
         return filepath
 
 
+class FastContentCalendarExcelGenerator:
+    """
+    xlsxwriter backend for ContentCalendarExcelGenerator
+
+    Writes the same tabs in constant_memory mode: each row is flushed to a
+    temp file as soon as the next one starts, so memory stays flat however
+    many pieces a calendar has. Rows must be written top to bottom.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.wb = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'strings_to_urls': False})
+
+        # Define colors
+        self.colors = {
+            'header': 'B4D3E8',  # Light blue
+            'pillar1': 'FFE5B4',  # Peach
+            'pillar2': 'D4F1D4',  # Light green
+            'pillar3': 'E8D4F1',  # Light purple
+            'pillar4': 'FFD4D4',  # Light red
+        }
+
+        # Shared formats
+        header_bg = '#' + self.colors['header']
+        self._header_format = self.wb.add_format({
+            'bg_color': header_bg, 'bold': True, 'font_color': '#000000',
+            'align': 'center', 'valign': 'vcenter'
+        })
+        self._light_header_format = self.wb.add_format({
+            'bg_color': header_bg, 'bold': True, 'font_color': '#FFFFFF',
+            'align': 'center', 'valign': 'vcenter'
+        })
+        self._bold_header_format = self.wb.add_format({'bg_color': header_bg, 'bold': True})
+        self._pillar_formats = {
+            num: self.wb.add_format({'bg_color': '#' + self.colors[f'pillar{num}']})
+            for num in range(1, 5)
+        }
+        self._section_format = self.wb.add_format({'font_size': 12, 'bold': True})
+        self._wrap = self.wb.add_format({'text_wrap': True, 'valign': 'top'})
+
+    def create_monthly_calendar_tab(self, content_pieces, brand_name, month):
+        """Create the main monthly calendar view"""
+        ws = self.wb.add_worksheet("Monthly Calendar")
+
+        for letter, width in _MONTHLY_WIDTHS.items():
+            ws.set_column(f'{letter}:{letter}', width)
+
+        # Title
+        ws.write(0, 0, f"{brand_name} - Content Calendar", self.wb.add_format({'font_size': 16, 'bold': True}))
+        ws.write(1, 0, month, self.wb.add_format({'font_size': 12, 'font_color': '#666666'}))
+
+        # Headers
+        headers = ['Date', 'Day', 'Content Title', 'Channel', 'Format', 'Pillar', 'Status', 'Notes']
+        ws.write_row(3, 0, headers, self._header_format)
+
+        # Content rows, colored by pillar
+        for row_idx, piece in enumerate(content_pieces, 4):
+            date = piece.get('suggested_date', '')
+            pillar = piece.get('pillar', '')
+            row = [
+                date,
+                _day_of_week(date),
+                piece.get('title', ''),
+                piece.get('channel', ''),
+                piece.get('format', ''),
+                pillar,
+                'Draft',  # Default status
+                ''  # Empty notes
+            ]
+            ws.write_row(row_idx, 0, row, self._pillar_formats.get(_pillar_number(pillar)))
+
+        return ws
+
+    def create_content_details_tab(self, content_pieces):
+        """Create detailed content specifications tab"""
+        ws = self.wb.add_worksheet("Content Details")
+
+        for letter, width in _DETAILS_WIDTHS.items():
+            ws.set_column(f'{letter}:{letter}', width)
+
+        detail_headers = [
+            "ID", "Week", "Title", "Pillar", "Channel", "Format",
+            "Key Message", "Description", "CTA", "Effort",
+            "Engagement", "SEO Keyword", "Notes"
+        ]
+        ws.write_row(0, 0, detail_headers, self._light_header_format)
+
+        # Wrap text for key message, description, CTA and notes columns
+        wrap = self._wrap
+        column_formats = [None] * 6 + [wrap] * 3 + [None] * 3 + [wrap]
+
+        for row_idx, piece in enumerate(content_pieces, 1):
+            detail_row = [
+                piece.get('content_id', ''),
+                piece.get('week', ''),
+                piece.get('title', ''),
+                piece.get('pillar', ''),
+                piece.get('channel', ''),
+                piece.get('format', ''),
+                piece.get('key_message', ''),
+                piece.get('description', ''),
+                piece.get('call_to_action', ''),
+                piece.get('effort_level', ''),
+                piece.get('engagement_potential', ''),
+                piece.get('seo_keyword', ''),
+                piece.get('execution_notes', '')
+            ]
+            for col, (value, cell_format) in enumerate(zip(detail_row, column_formats)):
+                ws.write(row_idx, col, value, cell_format)
+
+        return ws
+
+    def create_weekly_checklist_tab(self, content_pieces):
+        """Create weekly checklist view"""
+        ws = self.wb.add_worksheet("Weekly Checklist")
+
+        for letter, width in _CHECKLIST_WIDTHS.items():
+            ws.set_column(f'{letter}:{letter}', width)
+
+        ws.write_row(0, 0, ["Week", "Content ID", "Title", "Status", "Notes"], self._light_header_format)
+
+        # Grouped by week (stable sort keeps calendar order within a week)
+        for row_idx, piece in enumerate(sorted(content_pieces, key=_week_of), 1):
+            ws.write_row(row_idx, 0, [f"Week {_week_of(piece)}", piece.get('content_id', ''), piece.get('title', ''), "Pending", ""])
+
+        return ws
+
+    def create_metrics_tab(self, content_pieces, success_metrics=None):
+        """Create metrics tracking tab"""
+        ws = self.wb.add_worksheet("Metrics Tracker")
+
+        for letter, width in _METRICS_WIDTHS.items():
+            ws.set_column(f'{letter}:{letter}', width)
+
+        ws.write(0, 0, "Content Performance Metrics", self.wb.add_format({'font_size': 14, 'bold': True}))
+        ws.write(2, 0, "Target Metrics", self._section_format)
+
+        row_idx = 3
+        for metric in success_metrics or []:
+            ws.write_row(row_idx, 0, ['•', metric])
+            row_idx += 1
+
+        # Performance tracking table
+        row_idx += 2
+        ws.write(row_idx, 0, "Content Performance Tracking", self._section_format)
+        headers = ['Content ID', 'Title', 'Views', 'Engagement', 'Clicks', 'Conversions', 'Notes']
+        ws.write_row(row_idx + 1, 0, headers, self._bold_header_format)
+
+        # Empty rows for tracking
+        for row_idx, piece in enumerate(content_pieces, row_idx + 2):
+            ws.write_row(row_idx, 0, [piece.get('content_id', ''), piece.get('title', '')])
+
+        return ws
+
+    def save(self, filepath=None):
+        """Finish the workbook (it is written to the path given at construction)"""
+        self.wb.close()
+        return self.output_path
+
+
+def generate_content_calendar_xlsx_fast(brand_name, month, content_pieces, success_metrics=None, output_path='content_calendar.xlsx'):
+    """
+    Generate the Excel content calendar with the xlsxwriter backend
+
+    Same arguments and output as generate_content_calendar_xlsx; requires
+    xlsxwriter.
+    """
+    gen = FastContentCalendarExcelGenerator(output_path)
+
+    gen.create_monthly_calendar_tab(content_pieces, brand_name, month)
+    gen.create_content_details_tab(content_pieces)
+    gen.create_weekly_checklist_tab(content_pieces)
+    gen.create_metrics_tab(content_pieces, success_metrics)
+
+    return gen.save()
+
+
 def generate_content_calendar_xlsx(brand_name, month, content_pieces, success_metrics=None, output_path='content_calendar.xlsx'):
     """
     Generate a comprehensive Excel content calendar
@@ -267,6 +475,9 @@ def generate_content_calendar_xlsx(brand_name, month, content_pieces, success_me
     Returns:
         Path to saved file
     """
+    if xlsxwriter is not None:
+        return generate_content_calendar_xlsx_fast(brand_name, month, content_pieces, success_metrics, output_path)
+
     gen = ContentCalendarExcelGenerator()
 
     gen.create_monthly_calendar_tab(content_pieces, brand_name, month)
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import concurrent.futures
 import os
-import json
+import threading
+import orjson
 import yaml
 from crewai import Agent, Task, Crew, Process, LLM
 from dotenv import load_dotenv
 from document_generator import generate_strategy_docx, generate_calendar_docx
 from excel_generator import generate_content_calendar_xlsx
+from async_writer import AsyncArtifactWriter
+from content_parser import ContentCalendarParser, extract_strategy_text, parse_strategies_output
+from api.http_pool import install_shared_http_client
 
 # Load environment variables
 load_dotenv()
@@ -18,6 +24,30 @@ llm = LLM(
     temperature=0.7
 )
 
+# Generate all five calendars while the user picks a strategy, trading 5x the
+# Phase 2 LLM calls for no wait after the choice (SPECULATIVE_CALENDARS=1)
+SPECULATIVE_CALENDARS = os.getenv("SPECULATIVE_CALENDARS", "0") == "1"
+
+# Placeholder calendar for the DOCX/XLSX when the calendar output can't be parsed
+_MOCK_CONTENT_PIECES = tuple(
+    {
+        "content_id": i,
+        "week": (i-1)//5 + 1,
+        "suggested_date": f"January {i}, 2025",
+        "title": f"Content Piece {i}",
+        "channel": "LinkedIn",
+        "format": "Text Post",
+        "pillar": "Pillar 1",
+        "description": "Content description here",
+        "key_message": "Key message",
+        "call_to_action": "Take action",
+        "effort_level": "Medium",
+        "engagement_potential": "High",
+        "execution_notes": "How to create this"
+    }
+    for i in range(1, 21)
+)
+
 # Sample brand data for testing
 brand_data = """
 Brand Name: CloudFlow
@@ -38,6 +68,67 @@ Strategy Month: January 2025
 Additional Notes: Launching new AI feature next month - want to generate buzz
 """
 
+# Task descriptions, built once at import (the brand data is static);
+# the calendar template is filled in with the selected strategy number
+ANALYZE_TASK_DESC = f"""
+        Analyze the following brand information and create a comprehensive brand profile:
+
+        {brand_data}
+
+        Your analysis should include:
+        1. Brand Positioning Summary (2-3 sentences)
+        2. Primary Audience Characteristics
+        3. Key Differentiators
+        4. Content Opportunities
+        5. Channel-Specific Considerations
+        6. Constraints & Resources
+        7. Strategic Imperatives
+        8. Competitive Gaps
+
+        Be specific and insightful.
+        """
+
+CALENDAR_TASK_TEMPLATE = """
+        IMPORTANT: You must generate ALL 20-25 content pieces in a single response.
+
+        Create a detailed content calendar for January 2025 based on Strategy {selected_strategy}
+        from the strategies that were just generated.
+
+        YOU MUST GENERATE EXACTLY 20-25 CONTENT PIECES. DO NOT STOP EARLY.
+
+        For each content piece (numbered 1-25), provide (keep concise):
+
+        **Content #[number]**
+        Week [1-4] | [Date] | **Title:** [Specific title]
+        Pillar: [Name] | Channel: [Platform] | Format: [Type]
+        Message: [One sentence]
+        CTA: [Specific action]
+        Effort: [L/M/H]
+
+        ---
+
+        After all 20-25 content pieces, include:
+
+        ## EXECUTIVE SUMMARY
+        [2-3 sentences about the overall calendar strategy]
+
+        ## WEEKLY BREAKDOWN
+        **Week 1 (Jan 1-7):** [Summary]
+        **Week 2 (Jan 8-14):** [Summary]
+        **Week 3 (Jan 15-21):** [Summary]
+        **Week 4 (Jan 22-31):** [Summary]
+
+        ## CONTENT MIX
+        - By Format: [Breakdown]
+        - By Pillar: [Distribution]
+        - By Channel: [Distribution]
+
+        ## QUICK WINS
+        [3 pieces that are easy to create and high impact - list content #s]
+
+        REMEMBER: Generate all 20-25 pieces before moving to the summary sections.
+        """
+
 def display_strategy_summary(strategies_output):
     """Display a clean summary of all 5 strategies"""
     print("\n" + "="*70)
@@ -67,10 +158,18 @@ def get_user_strategy_choice():
 def parse_strategies_for_docx(strategies_text):
     """
     Parse the strategy text into structured data for DOCX generation.
-    This is a simple parser - in production you'd use structured output from agents.
+
+    Uses the shared single-pass parser (precompiled regexes, one scan of the
+    text); falls back to placeholder strategies if nothing could be parsed.
     """
-    # For now, return mock structured data
-    # In the next enhancement, we'll use proper Pydantic models
+    strategies = parse_strategies_output(strategies_text)
+    if strategies:
+        return strategies[:5]
+
+    return _placeholder_strategies()
+
+def _placeholder_strategies():
+    """Placeholder structured data for when the strategy text can't be parsed"""
     strategies = []
     for i in range(1, 6):
         strategies.append({
@@ -90,13 +189,129 @@ def parse_strategies_for_docx(strategies_text):
         })
     return strategies
 
-def run_interactive_workflow():
+def generate_strategy_document(strategies_output, selected_strategy):
+    """Generate the strategy options DOCX (runs alongside Phase 2)"""
+    try:
+        strategies_structured = parse_strategies_for_docx(strategies_output)
+        strategy_docx_path = generate_strategy_docx(
+            brand_name="CloudFlow",
+            strategies_list=strategies_structured,
+            recommendation=f"We recommend Strategy {selected_strategy} based on your analysis.",
+            output_path="outputs/strategy_options.docx"
+        )
+        print(f"   ✅ Strategy options document: {strategy_docx_path}")
+    except Exception as e:
+        print(f"   ⚠️  Strategy DOCX generation failed: {str(e)}")
+
+def generate_calendar_documents(selected_strategy, calendar_output):
+    """Generate the content calendar DOCX and XLSX from the Phase 2 output"""
+    parsed_calendar = ContentCalendarParser().parse_calendar_output(calendar_output)
+
+    # Fall back to placeholder pieces if the calendar couldn't be parsed
+    content_pieces = parsed_calendar['content_pieces'] or list(_MOCK_CONTENT_PIECES)
+    executive_summary = (
+        parsed_calendar['executive_summary']
+        or f"This calendar brings your strategy to life with {len(content_pieces)} pieces of content."
+    )
+
+    # Generate Calendar DOCX
+    try:
+        calendar_docx_path = generate_calendar_docx(
+            brand_name="CloudFlow",
+            strategy_name=f"Strategy {selected_strategy}",
+            month="January 2025",
+            executive_summary=executive_summary,
+            content_pieces=content_pieces,
+            output_path="outputs/content_calendar.docx"
+        )
+        print(f"   ✅ Content calendar document: {calendar_docx_path}")
+    except Exception as e:
+        print(f"   ⚠️  Calendar DOCX generation failed: {str(e)}")
+
+    # Generate Calendar XLSX
+    try:
+        success_metrics = [
+            "Engagement rate > 3%",
+            "50+ qualified leads per month",
+            "Website traffic increase of 25%",
+            "Social follower growth of 15%"
+        ]
+
+        xlsx_path = generate_content_calendar_xlsx(
+            brand_name="CloudFlow",
+            month="January 2025",
+            content_pieces=content_pieces,
+            success_metrics=success_metrics,
+            output_path="outputs/content_calendar.xlsx"
+        )
+        print(f"   ✅ Content calendar spreadsheet: {xlsx_path}")
+    except Exception as e:
+        print(f"   ⚠️  XLSX generation failed: {str(e)}")
+
+def _run_in_background(fn):
+    """
+    Start fn on a daemon thread and return a concurrent.futures.Future for it
+
+    Daemon threads don't hold up exit if the user cancels while they run.
+    """
+    future = concurrent.futures.Future()
+
+    def run():
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+async def stream_crew_to_files(crew, paths_by_role):
+    """
+    Run a streaming crew, appending each agent's text to its file as it arrives
+
+    Lets the user `tail -f` the long LLM calls instead of waiting on the full
+    response. The files hold the raw stream (including the agent's reasoning)
+    and are replaced with the final task outputs once the crew finishes.
+
+    Args:
+        crew: Crew created with stream=True
+        paths_by_role: Output path for each agent role; chunks are matched by
+            role because CrewAI doesn't tag them with the running task
+
+    Returns:
+        The crew's final result
+    """
+    files = {}
+    try:
+        stream = await crew.kickoff_async()
+        async for chunk in stream:
+            path = paths_by_role.get(chunk.agent_role)
+            if not chunk.content or path is None:
+                continue
+
+            f = files.get(path)
+            if f is None:
+                f = files[path] = open(path, "w", encoding="utf-8")
+            f.write(chunk.content)
+            f.flush()
+    finally:
+        for f in files.values():
+            f.close()
+
+    return stream.result
+
+async def run_interactive_workflow():
     """Run the workflow with interactive strategy selection"""
 
     print("\n" + "="*70)
     print("🚀 AI CONTENT MARKETING STRATEGIST - INTERACTIVE MODE")
     print("="*70 + "\n")
 
+    # Reuse one HTTP connection pool for every agent's LLM calls. kickoff_async
+    # runs each crew on a worker thread through LiteLLM's synchronous client, so
+    # this pool serves both phases
+    install_shared_http_client()
+
     # Create agents
     brand_analyst = Agent(
         role="Senior Brand Analyst",
@@ -117,7 +332,7 @@ def run_interactive_workflow():
                      always complete your full assignment - if asked for 5 strategies, you deliver all 5.""",
         verbose=True,
         allow_delegation=False,
-        max_iter=25,
+        max_iter=5,
         llm=llm
     )
 
@@ -130,32 +345,17 @@ def run_interactive_workflow():
                      content titles that could be published as-is.""",
         verbose=True,
         allow_delegation=False,
-        max_iter=35,
+        max_iter=5,
         llm=llm
     )
 
     # PHASE 1: Brand Analysis + Strategy Generation
     print("📋 PHASE 1: Analyzing brand and generating 5 strategy options...")
-    print("   This will take about 90-120 seconds...\n")
+    print("   This will take about 90-120 seconds...")
+    print("   (follow along with: tail -f outputs/2_five_strategies.md)\n")
 
     analyze_brand = Task(
-        description=f"""
-        Analyze the following brand information and create a comprehensive brand profile:
-
-        {brand_data}
-
-        Your analysis should include:
-        1. Brand Positioning Summary (2-3 sentences)
-        2. Primary Audience Characteristics
-        3. Key Differentiators
-        4. Content Opportunities
-        5. Channel-Specific Considerations
-        6. Constraints & Resources
-        7. Strategic Imperatives
-        8. Competitive Gaps
-
-        Be specific and insightful.
-        """,
+        description=ANALYZE_TASK_DESC,
         expected_output="A comprehensive brand analysis document",
         agent=brand_analyst
     )
@@ -202,25 +402,63 @@ def run_interactive_workflow():
         agents=[brand_analyst, strategy_architect],
         tasks=[analyze_brand, generate_strategies],
         process=Process.sequential,
-        verbose=True
+        verbose=True,
+        stream=True
     )
 
-    strategies_result = phase1_crew.kickoff()
+    # Markdown/JSON/YAML artifacts are written in the background
+    writer = AsyncArtifactWriter()
+
+    strategies_result = await stream_crew_to_files(phase1_crew, {
+        brand_analyst.role: "outputs/1_brand_analysis.md",
+        strategy_architect.role: "outputs/2_five_strategies.md"
+    })
 
     # Save Phase 1 outputs
-    brand_analysis_output = analyze_brand.output.raw if hasattr(analyze_brand.output, 'raw') else str(analyze_brand.output)
+    brand_analysis_output = analyze_brand.output.raw
     strategies_output = str(strategies_result)
 
-    with open("outputs/1_brand_analysis.md", "w", encoding="utf-8") as f:
-        f.write(brand_analysis_output)
-
-    with open("outputs/2_five_strategies.md", "w", encoding="utf-8") as f:
-        f.write(strategies_output)
+    writer.submit("outputs/1_brand_analysis.md", brand_analysis_output)
+    writer.submit("outputs/2_five_strategies.md", strategies_output)
 
     print("\n✅ Phase 1 Complete!")
     print("   - Brand analysis saved to outputs/1_brand_analysis.md")
     print("   - 5 strategies saved to outputs/2_five_strategies.md")
 
+    def build_calendar_crew(strategy_number, agent, verbose=True, stream=True):
+        """Phase 2 crew expanding one strategy into the content calendar"""
+        # Send only the selected strategy rather than all five as Phase 2 context
+        calendar_description = CALENDAR_TASK_TEMPLATE.format(selected_strategy=strategy_number)
+        calendar_context = [analyze_brand, generate_strategies]
+
+        selected_strategy_text = extract_strategy_text(strategies_output, strategy_number)
+        if selected_strategy_text:
+            calendar_description += f"\nSELECTED STRATEGY:\n{selected_strategy_text}\n"
+            calendar_context = [analyze_brand]
+
+        build_calendar_interactive = Task(
+            description=calendar_description,
+            expected_output="Complete content calendar with 20-25 pieces",
+            agent=agent,
+            context=calendar_context
+        )
+
+        return Crew(
+            agents=[agent],
+            tasks=[build_calendar_interactive],
+            process=Process.sequential,
+            verbose=verbose,
+            stream=stream
+        )
+
+    # Optionally start every strategy's calendar while the user is choosing
+    # (5x the Phase 2 LLM calls; the four unused ones still run to completion)
+    speculative_calendars = {}
+    if SPECULATIVE_CALENDARS:
+        for number in range(1, 6):
+            crew = build_calendar_crew(number, content_calendar_specialist.copy(), verbose=False, stream=False)
+            speculative_calendars[number] = _run_in_background(crew.kickoff)
+
     # Display strategies and get user choice
     display_strategy_summary(strategies_output)
 
@@ -231,72 +469,41 @@ def run_interactive_workflow():
 
     # PHASE 2: Content Calendar for Selected Strategy
     print("📅 PHASE 2: Creating detailed content calendar...")
-    print("   This will take about 60-90 seconds...\n")
-
-    # Create new calendar task with the selected strategy
-    build_calendar_interactive = Task(
-        description=f"""
-        IMPORTANT: You must generate ALL 20-25 content pieces in a single response.
-
-        Create a detailed content calendar for January 2025 based on Strategy {selected_strategy}
-        from the strategies that were just generated.
-
-        YOU MUST GENERATE EXACTLY 20-25 CONTENT PIECES. DO NOT STOP EARLY.
-
-        For each content piece (numbered 1-25), provide (keep concise):
-
-        **Content #[number]**
-        Week [1-4] | [Date] | **Title:** [Specific title]
-        Pillar: [Name] | Channel: [Platform] | Format: [Type]
-        Message: [One sentence]
-        CTA: [Specific action]
-        Effort: [L/M/H]
-
-        ---
-
-        After all 20-25 content pieces, include:
-
-        ## EXECUTIVE SUMMARY
-        [2-3 sentences about the overall calendar strategy]
-
-        ## WEEKLY BREAKDOWN
-        **Week 1 (Jan 1-7):** [Summary]
-        **Week 2 (Jan 8-14):** [Summary]
-        **Week 3 (Jan 15-21):** [Summary]
-        **Week 4 (Jan 22-31):** [Summary]
-
-        ## CONTENT MIX
-        - By Format: [Breakdown]
-        - By Pillar: [Distribution]
-        - By Channel: [Distribution]
-
-        ## QUICK WINS
-        [3 pieces that are easy to create and high impact - list content #s]
-
-        REMEMBER: Generate all 20-25 pieces before moving to the summary sections.
-        """,
-        expected_output="Complete content calendar with 20-25 pieces",
-        agent=content_calendar_specialist,
-        context=[analyze_brand, generate_strategies]
+    if speculative_calendars:
+        print("   Started while you were choosing; waiting for it to finish...\n")
+    else:
+        print("   This will take about 60-90 seconds...")
+        print("   (follow along with: tail -f outputs/3_content_calendar.md)\n")
+
+    # The strategy document only needs Phase 1 output, so build it on a
+    # worker thread while Phase 2 runs
+    strategy_docx_task = asyncio.create_task(
+        asyncio.to_thread(generate_strategy_document, strategies_output, selected_strategy)
     )
 
-    phase2_crew = Crew(
-        agents=[content_calendar_specialist],
-        tasks=[build_calendar_interactive],
-        process=Process.sequential,
-        verbose=True
-    )
-
-    calendar_result = phase2_crew.kickoff()
+    if speculative_calendars:
+        calendar_result = await asyncio.wrap_future(speculative_calendars[selected_strategy])
+    else:
+        calendar_result = await stream_crew_to_files(
+            build_calendar_crew(selected_strategy, content_calendar_specialist),
+            {content_calendar_specialist.role: "outputs/3_content_calendar.md"}
+        )
 
     # Save Phase 2 outputs
     calendar_output = str(calendar_result)
 
-    with open("outputs/3_content_calendar.md", "w", encoding="utf-8") as f:
-        f.write(calendar_output)
+    # Calendar documents are built from the parsed calendar while the
+    # remaining artifacts are written
+    calendar_docs_task = asyncio.create_task(
+        asyncio.to_thread(generate_calendar_documents, selected_strategy, calendar_output)
+    )
 
-    # Create comprehensive package
-    comprehensive_output = f"""# AI Content Marketing Strategy - Complete Report
+    writer.submit("outputs/3_content_calendar.md", calendar_output)
+
+    # Create comprehensive package as sections; the writer streams them to
+    # disk back to back instead of building one large string
+    comprehensive_parts = (
+        f"""# AI Content Marketing Strategy - Complete Report
 Generated: January 2025
 Brand: CloudFlow
 Selected Strategy: #{selected_strategy} (User Choice - Interactive Mode)
@@ -305,19 +512,25 @@ Selected Strategy: #{selected_strategy} (User Choice - Interactive Mode)
 
 # PART 1: BRAND ANALYSIS
 
-{brand_analysis_output}
+""",
+        brand_analysis_output,
+        """
 
 ---
 
 # PART 2: STRATEGY OPTIONS (5 Complete Strategies)
 
-{strategies_output}
+""",
+        strategies_output,
+        f"""
 
 ---
 
 # PART 3: CONTENT CALENDAR (Strategy {selected_strategy})
 
-{calendar_output}
+""",
+        calendar_output,
+        f"""
 
 ---
 
@@ -331,9 +544,9 @@ Selected Strategy: #{selected_strategy} (User Choice - Interactive Mode)
 
 *Generated by AI Content Marketing Strategist (CrewAI) - Interactive Mode*
 """
+    )
 
-    with open("outputs/complete_strategy_package_interactive.md", "w", encoding="utf-8") as f:
-        f.write(comprehensive_output)
+    writer.submit("outputs/complete_strategy_package_interactive.md", comprehensive_parts)
 
     # Save as JSON/YAML too
     outputs = {
@@ -343,80 +556,23 @@ Selected Strategy: #{selected_strategy} (User Choice - Interactive Mode)
         "calendar": calendar_output
     }
 
-    with open("outputs/interactive_output.json", "w", encoding="utf-8") as f:
-        json.dump(outputs, f, indent=2, ensure_ascii=False)
-
-    with open("outputs/interactive_output.yaml", "w", encoding="utf-8") as f:
-        yaml.dump(outputs, f, default_flow_style=False, allow_unicode=True)
+    writer.submit(
+        "outputs/interactive_output.json",
+        orjson.dumps(outputs, option=orjson.OPT_INDENT_2).decode("utf-8")
+    )
+    writer.submit(
+        "outputs/interactive_output.yaml",
+        yaml.dump(outputs, Dumper=getattr(yaml, "CDumper", yaml.Dumper), default_flow_style=False, allow_unicode=True)
+    )
 
     # Generate DOCX documents
     print("\n📄 Generating professional documents...")
 
-    # Generate Strategy Options DOCX
-    try:
-        strategies_structured = parse_strategies_for_docx(strategies_output)
-        strategy_docx_path = generate_strategy_docx(
-            brand_name="CloudFlow",
-            strategies_list=strategies_structured,
-            recommendation=f"We recommend Strategy {selected_strategy} based on your analysis.",
-            output_path="outputs/strategy_options.docx"
-        )
-        print(f"   ✅ Strategy options document: {strategy_docx_path}")
-    except Exception as e:
-        print(f"   ⚠️  Strategy DOCX generation failed: {str(e)}")
-
-    # Generate Calendar DOCX (simplified for now)
-    try:
-        # Mock calendar data for now
-        mock_content_pieces = []
-        for i in range(1, 21):
-            mock_content_pieces.append({
-                "content_id": i,
-                "week": (i-1)//5 + 1,
-                "suggested_date": f"January {i}, 2025",
-                "title": f"Content Piece {i}",
-                "channel": "LinkedIn",
-                "format": "Text Post",
-                "pillar": "Pillar 1",
-                "description": "Content description here",
-                "key_message": "Key message",
-                "call_to_action": "Take action",
-                "effort_level": "Medium",
-                "engagement_potential": "High",
-                "execution_notes": "How to create this"
-            })
+    await asyncio.gather(strategy_docx_task, calendar_docs_task)
 
-        calendar_docx_path = generate_calendar_docx(
-            brand_name="CloudFlow",
-            strategy_name=f"Strategy {selected_strategy}",
-            month="January 2025",
-            executive_summary="This calendar brings your strategy to life with 20 pieces of content.",
-            content_pieces=mock_content_pieces,
-            output_path="outputs/content_calendar.docx"
-        )
-        print(f"   ✅ Content calendar document: {calendar_docx_path}")
-    except Exception as e:
-        print(f"   ⚠️  Calendar DOCX generation failed: {str(e)}")
-
-    # Generate Calendar XLSX
-    try:
-        success_metrics = [
-            "Engagement rate > 3%",
-            "50+ qualified leads per month",
-            "Website traffic increase of 25%",
-            "Social follower growth of 15%"
-        ]
-
-        xlsx_path = generate_content_calendar_xlsx(
-            brand_name="CloudFlow",
-            month="January 2025",
-            content_pieces=mock_content_pieces,
-            success_metrics=success_metrics,
-            output_path="outputs/content_calendar.xlsx"
-        )
-        print(f"   ✅ Content calendar spreadsheet: {xlsx_path}")
-    except Exception as e:
-        print(f"   ⚠️  XLSX generation failed: {str(e)}")
+    # Make sure every queued artifact is on disk before reporting
+    for path, error in writer.flush_and_join():
+        print(f"   ⚠️  Failed to write {path}: {error}")
 
     # Final summary
     print("\n" + "="*70)
@@ -440,4 +596,4 @@ Selected Strategy: #{selected_strategy} (User Choice - Interactive Mode)
     print("="*70 + "\n")
 
 if __name__ == "__main__":
-    run_interactive_workflow()
+    asyncio.run(run_interactive_workflow())
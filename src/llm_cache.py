@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent response cache for CrewAI LLM calls
+Re-running the same brand (or retrying after a cancelled run) is served from
+disk instead of waiting on OpenRouter again
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from crewai import LLM
+
+CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache.db")
+TTL_SECONDS = 24 * 3600  # 24 hours
+MAX_ENTRIES = 500
+
+
+class ResponseCache:
+    """SQLite-backed prompt -> response cache with TTL and LRU eviction"""
+
+    def __init__(self, path: str = CACHE_PATH, ttl_seconds: int = TTL_SECONDS,
+                 max_entries: int = MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing/expired"""
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            response, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response and evict least recently used entries over the cap"""
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response, now, now)
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+
+class CachingLLM(LLM):
+    """CrewAI LLM that short-circuits repeated prompts through ResponseCache"""
+
+    _cache: Optional[ResponseCache] = None
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_cache(cls) -> ResponseCache:
+        """Open the shared cache on first use"""
+        with cls._cache_lock:
+            if cls._cache is None:
+                cls._cache = ResponseCache()
+            return cls._cache
+
+    def _cache_key(self, messages) -> str:
+        """Hash everything that determines the completion"""
+        payload = json.dumps(
+            {
+                "model": self.model,
+                "temperature": self.temperature,
+                "stop": self.stop,
+                "messages": messages
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        """Serve plain-text completions from cache; tool and structured calls pass through"""
+        if tools or available_functions or response_model:
+            return super().call(
+                messages, tools=tools, callbacks=callbacks,
+                available_functions=available_functions, from_task=from_task,
+                from_agent=from_agent, response_model=response_model
+            )
+
+        cache = self._get_cache()
+        key = self._cache_key(messages)
+
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = super().call(
+            messages, callbacks=callbacks, from_task=from_task, from_agent=from_agent
+        )
+
+        if isinstance(result, str):
+            cache.put(key, result)
+
+        return result
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
-import json
+import orjson
 import yaml
 from crewai import Agent, Task, Crew, Process
 from langchain_openai import ChatOpenAI
@@ -10,6 +10,12 @@ from models import BrandAnalysis, StrategiesOutput, ContentCalendar
 # Load environment variables
 load_dotenv()
 
+# orjson options for pretty-printed JSON artifacts
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# libyaml's C emitter when PyYAML was built with it
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
 # Helper function to save structured outputs in multiple formats
 def save_structured_outputs(brand_analysis_obj, strategies_obj, calendar_obj):
     """Save outputs in multiple structured formats (JSON and YAML)"""
@@ -27,12 +33,12 @@ def save_structured_outputs(brand_analysis_obj, strategies_obj, calendar_obj):
         outputs["calendar"] = calendar_obj.dict()
 
     # Save as JSON
-    with open("outputs/structured_output.json", "w", encoding="utf-8") as f:
-        json.dump(outputs, f, indent=2, ensure_ascii=False)
+    with open("outputs/structured_output.json", "wb") as f:
+        f.write(orjson.dumps(outputs, option=JSON_OPTIONS))
 
     # Save as YAML (more human-readable)
     with open("outputs/structured_output.yaml", "w", encoding="utf-8") as f:
-        yaml.dump(outputs, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(outputs, f, Dumper=YAML_DUMPER, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
     print("   - outputs/structured_output.json (all combined)")
     print("   - outputs/structured_output.yaml (all combined)")
@@ -94,7 +100,7 @@ strategy_architect = Agent(
                  your full assignment - if asked for 5 strategies, you deliver all 5.""",
     verbose=True,
     allow_delegation=False,
-    max_iter=25,  # Allow more iterations to complete all 5 strategies
+    max_iter=5,  # No tools; structured output validation ends the task
     llm=llm
 )
 
@@ -111,7 +117,7 @@ content_calendar_specialist = Agent(
                  content titles that could be published as-is.""",
     verbose=True,
     allow_delegation=False,
-    max_iter=35,  # Allow enough iterations for 20-25 content pieces
+    max_iter=5,  # No tools; structured output validation ends the task
     llm=llm
 )
 
@@ -326,9 +332,9 @@ if __name__ == "__main__":
         calendar_obj = result.pydantic if hasattr(result, 'pydantic') else None
 
         # Also get raw text outputs for markdown
-        brand_analysis_output = analyze_brand.output.raw if hasattr(analyze_brand.output, 'raw') else str(analyze_brand.output)
-        strategies_output = generate_strategies.output.raw if hasattr(generate_strategies.output, 'raw') else str(generate_strategies.output)
-        calendar_output = result.raw if hasattr(result, 'raw') else str(result)
+        brand_analysis_output = analyze_brand.output.raw
+        strategies_output = generate_strategies.output.raw
+        calendar_output = result.raw
 
         # Create comprehensive document with all outputs
         comprehensive_output = f"""# AI Content Marketing Strategy - Complete Report
@@ -392,18 +398,18 @@ Brand: CloudFlow
 
         # Save structured JSON outputs if Pydantic objects are available
         if brand_analysis_obj:
-            with open("outputs/1_brand_analysis.json", "w", encoding="utf-8") as f:
-                json.dump(brand_analysis_obj.dict(), f, indent=2)
+            with open("outputs/1_brand_analysis.json", "wb") as f:
+                f.write(orjson.dumps(brand_analysis_obj.dict(), option=JSON_OPTIONS))
             print("   - outputs/1_brand_analysis.json (structured)")
 
         if strategies_obj:
-            with open("outputs/2_five_strategies.json", "w", encoding="utf-8") as f:
-                json.dump(strategies_obj.dict(), f, indent=2)
+            with open("outputs/2_five_strategies.json", "wb") as f:
+                f.write(orjson.dumps(strategies_obj.dict(), option=JSON_OPTIONS))
             print("   - outputs/2_five_strategies.json (structured)")
 
         if calendar_obj:
-            with open("outputs/3_content_calendar.json", "w", encoding="utf-8") as f:
-                json.dump(calendar_obj.dict(), f, indent=2)
+            with open("outputs/3_content_calendar.json", "wb") as f:
+                f.write(orjson.dumps(calendar_obj.dict(), option=JSON_OPTIONS))
             print("   - outputs/3_content_calendar.json (structured)")
 
         # Save combined structured outputs in JSON and YAML
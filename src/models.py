@@ -68,7 +68,7 @@ class StrategyRecommendation(BaseModel):
     week_1_actions: List[str]
 
 class StrategiesOutput(BaseModel):
-    strategies: List[ContentStrategy]
+    strategies: List[ContentStrategy] = Field(min_length=5, max_length=5)
     recommendation: StrategyRecommendation
 
 # Content Calendar Model
@@ -92,7 +92,7 @@ class ContentPiece(BaseModel):
 
 class ContentCalendar(BaseModel):
     executive_summary: str
-    content_pieces: List[ContentPiece]
+    content_pieces: List[ContentPiece] = Field(min_length=20, max_length=25)
     weekly_breakdown: dict
     content_mix_analysis: dict
     success_metrics: List[str]
@@ -5,9 +5,15 @@ Simple password protection with session management
 
 import streamlit as st
 import hashlib
+import hmac
+import secrets
 from typing import Optional
 
 
+# Per-process key for password digests; hashes are only compared in memory
+_HASH_KEY = secrets.token_bytes(32)
+
+
 class BetaAuthenticator:
     """Simple password authentication for beta access"""
 
@@ -47,8 +53,8 @@ class BetaAuthenticator:
             st.session_state.authenticated = True
             return True
 
-        # Hash input password and compare
-        if self._hash_password(input_password) == self._hash_password(self.password):
+        # Hash input password and compare in constant time
+        if hmac.compare_digest(self._hash_password(input_password), self._hash_password(self.password)):
             st.session_state.authenticated = True
             return True
 
@@ -119,7 +125,7 @@ class BetaAuthenticator:
     @staticmethod
     def _hash_password(password: str) -> str:
         """
-        Hash password using SHA256
+        Hash password using keyed BLAKE2b
 
         Args:
             password: Plain text password
@@ -127,7 +133,7 @@ class BetaAuthenticator:
         Returns:
             Hashed password
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        return hashlib.blake2b(password.encode(), key=_HASH_KEY, digest_size=32).hexdigest()
 
 
 class DevelopmentAuthenticator(BetaAuthenticator):
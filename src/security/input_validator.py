@@ -4,15 +4,15 @@ Prevents XSS, prompt injection, and validates all user inputs
 """
 
 import re
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, FrozenSet, List, Tuple, Any, Optional
 import html
 
 
 class InputValidator:
     """Validates and sanitizes all user inputs"""
 
-    # Whitelisted values for dropdown selections
-    VALID_INDUSTRIES = [
+    # Whitelisted values for dropdown selections (frozensets for O(1) lookup)
+    VALID_INDUSTRIES = frozenset({
         "B2B SaaS", "E-commerce - Fashion", "E-commerce - Electronics",
         "Local Services", "Healthcare", "Education", "Finance",
         "Real Estate", "Food & Beverage", "Travel & Hospitality",
@@ -21,40 +21,40 @@ class InputValidator:
         "Professional Services", "Home Services", "Automotive",
         "Beauty & Wellness", "Sports & Fitness", "Media & Publishing",
         "Other"
-    ]
+    })
 
-    VALID_CHANNELS = [
+    VALID_CHANNELS = frozenset({
         "LinkedIn", "Twitter", "Instagram", "Facebook",
         "TikTok", "Blog", "YouTube", "Pinterest",
         "Email Newsletter", "Podcast", "Medium"
-    ]
+    })
 
-    VALID_TONES = [
+    VALID_TONES = frozenset({
         "Professional & Corporate",
         "Professional yet Approachable",
         "Casual & Friendly",
         "Playful & Fun",
         "Authoritative & Expert",
         "Inspirational & Aspirational"
-    ]
+    })
 
-    VALID_BUDGETS = [
+    VALID_BUDGETS = frozenset({
         "Under $500",
         "$500 - $1,000",
         "$1,000 - $2,500",
         "$2,500 - $5,000",
         "$5,000 - $10,000",
         "$10,000+"
-    ]
+    })
 
-    VALID_TIME_COMMITMENTS = [
+    VALID_TIME_COMMITMENTS = frozenset({
         "5-10 hours/week",
         "10-20 hours/week",
         "20-30 hours/week",
         "30+ hours/week"
-    ]
+    })
 
-    VALID_BUSINESS_GOALS = [
+    VALID_BUSINESS_GOALS = frozenset({
         "Brand Awareness",
         "Lead Generation",
         "Sales",
@@ -62,16 +62,16 @@ class InputValidator:
         "Community Building",
         "Customer Retention",
         "Thought Leadership"
-    ]
+    })
 
-    VALID_RESOURCES = [
+    VALID_RESOURCES = frozenset({
         "In-house writer",
         "In-house designer",
         "In-house video editor",
         "Freelancers",
         "AI tools (ChatGPT, etc.)",
         "No dedicated resources"
-    ]
+    })
 
     # Dangerous patterns that might indicate injection attempts
     INJECTION_PATTERNS = [
@@ -104,6 +104,15 @@ class InputValidator:
         r'\boverride\b.*\binstructions\b'
     ]
 
+    # All injection patterns compiled once into a single alternation
+    INJECTION_REGEX = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in INJECTION_PATTERNS),
+        re.IGNORECASE
+    )
+
+    # Characters that sanitize_text must escape or strip
+    UNSAFE_CHARS_REGEX = re.compile(r'[&<>"\'\x00]')
+
     def __init__(self):
         """Initialize validator"""
         self.errors: List[str] = []
@@ -282,15 +291,16 @@ class InputValidator:
 
         return True
 
-    def _validate_dropdown(self, value: str, valid_options: List[str], field_name: str) -> bool:
+    def _validate_dropdown(self, value: str, valid_options: FrozenSet[str], field_name: str) -> bool:
         """Validate dropdown selection"""
-        if value not in valid_options:
+        # Non-string values are rejected before the (hash-based) lookup
+        if not isinstance(value, str) or value not in valid_options:
             self.errors.append(f"{field_name} selection is invalid")
             return False
 
         return True
 
-    def _validate_multi_select(self, values: List[str], valid_options: List[str],
+    def _validate_multi_select(self, values: List[str], valid_options: FrozenSet[str],
                                min_selections: int, max_selections: int,
                                field_name: str) -> bool:
         """Validate multi-select input"""
@@ -308,7 +318,7 @@ class InputValidator:
 
         # Check all values are in whitelist
         for value in values:
-            if value not in valid_options:
+            if not isinstance(value, str) or value not in valid_options:
                 self.errors.append(f"{field_name}: Invalid selection '{value}'")
                 return False
 
@@ -316,16 +326,10 @@ class InputValidator:
 
     def _contains_injection_pattern(self, value: str) -> bool:
         """Check if value contains potential injection patterns"""
-        value_lower = value.lower()
-
-        for pattern in self.INJECTION_PATTERNS:
-            if re.search(pattern, value_lower, re.IGNORECASE):
-                return True
+        return self.INJECTION_REGEX.search(value) is not None
 
-        return False
-
-    @staticmethod
-    def sanitize_text(value: str) -> str:
+    @classmethod
+    def sanitize_text(cls, value: str) -> str:
         """
         Sanitize text for safe display
         Escapes HTML and removes dangerous characters
@@ -333,13 +337,17 @@ class InputValidator:
         if not value:
             return ""
 
-        # HTML escape
-        sanitized = html.escape(value)
+        # One scan decides whether any work is needed; clean text is
+        # returned as-is without the escape/replace passes
+        if not cls.UNSAFE_CHARS_REGEX.search(value):
+            return value
 
         # Remove null bytes
-        sanitized = sanitized.replace('\x00', '')
+        if '\x00' in value:
+            value = value.replace('\x00', '')
 
-        return sanitized
+        # HTML escape
+        return html.escape(value, quote=True)
 
     @staticmethod
     def sanitize_for_filename(value: str) -> str:
@@ -1,30 +1,37 @@
 """
 Session-based rate limiting to prevent abuse
-Tracks requests per user session with time windows
+Token bucket per user session, refilled continuously over the time window
 """
 
 import streamlit as st
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
 
 class RateLimiter:
-    """Session-based rate limiter for Streamlit"""
+    """Session-based token-bucket rate limiter for Streamlit"""
+
+    # Per-bucket locks sharded so concurrent sessions rarely contend
+    SHARDS = 256
+    _shard_locks = tuple(threading.Lock() for _ in range(SHARDS))
 
     def __init__(self, max_requests: int = 5, window_seconds: int = 3600):
         """
         Initialize rate limiter
 
         Args:
-            max_requests: Maximum requests allowed per window
+            max_requests: Maximum requests allowed per window (bucket capacity)
             window_seconds: Time window in seconds (default: 3600 = 1 hour)
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        self.refill_per_second = max_requests / window_seconds
 
-        # Initialize session state for rate limiting
-        if 'rate_limit_requests' not in st.session_state:
-            st.session_state.rate_limit_requests = []
+        # Initialize session state for rate limiting: [tokens, last_refill]
+        if 'rate_limit_bucket' not in st.session_state:
+            st.session_state.rate_limit_bucket = [float(max_requests), time.monotonic()]
 
     def is_allowed(self) -> bool:
         """
@@ -33,16 +40,15 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limited
         """
-        now = datetime.now()
+        bucket = st.session_state.rate_limit_bucket
 
-        # Clean up old requests outside the window
-        self._clean_old_requests(now)
+        with self._lock_for(bucket):
+            self._refill(bucket, time.monotonic())
 
-        # Check if under limit
-        if len(st.session_state.rate_limit_requests) < self.max_requests:
-            # Record this request
-            st.session_state.rate_limit_requests.append(now)
-            return True
+            # Spend a token if one is available
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return True
 
         return False
 
@@ -53,26 +59,31 @@ class RateLimiter:
         Returns:
             Number of requests remaining
         """
-        now = datetime.now()
-        self._clean_old_requests(now)
+        bucket = st.session_state.rate_limit_bucket
+
+        with self._lock_for(bucket):
+            tokens = self._refill(bucket, time.monotonic())
 
-        remaining = self.max_requests - len(st.session_state.rate_limit_requests)
-        return max(0, remaining)
+        return max(0, int(tokens))
 
     def get_reset_time(self) -> Optional[datetime]:
         """
-        Get time when rate limit will reset
+        Get time when the next request will be allowed
 
         Returns:
-            Datetime when oldest request expires, or None if no requests
+            Datetime when the next token is available, or None if one already is
         """
-        if not st.session_state.rate_limit_requests:
+        bucket = st.session_state.rate_limit_bucket
+
+        with self._lock_for(bucket):
+            tokens = self._refill(bucket, time.monotonic())
+
+        if tokens >= 1:
             return None
 
-        oldest_request = min(st.session_state.rate_limit_requests)
-        reset_time = oldest_request + timedelta(seconds=self.window_seconds)
+        seconds_left = (1 - tokens) / self.refill_per_second
 
-        return reset_time
+        return datetime.now() + timedelta(seconds=seconds_left)
 
     def get_time_until_reset(self) -> Optional[str]:
         """
@@ -149,16 +160,21 @@ class RateLimiter:
 
     def reset_for_session(self):
         """Reset rate limit for current session (admin/testing only)"""
-        st.session_state.rate_limit_requests = []
+        st.session_state.rate_limit_bucket = [float(self.max_requests), time.monotonic()]
+
+    def _lock_for(self, bucket: list) -> threading.Lock:
+        """Pick the shard lock for a session's bucket"""
+        # Object addresses are 16-byte aligned; drop the constant low bits
+        return self._shard_locks[(id(bucket) >> 4) & (self.SHARDS - 1)]
+
+    def _refill(self, bucket: list, now: float) -> float:
+        """Add tokens earned since the last refill, capped at capacity"""
+        elapsed = now - bucket[1]
 
-    def _clean_old_requests(self, now: datetime):
-        """Remove requests outside the time window"""
-        cutoff = now - timedelta(seconds=self.window_seconds)
+        bucket[0] = min(float(self.max_requests), bucket[0] + elapsed * self.refill_per_second)
+        bucket[1] = now
 
-        st.session_state.rate_limit_requests = [
-            req for req in st.session_state.rate_limit_requests
-            if req > cutoff
-        ]
+        return bucket[0]
 
 
 class DevelopmentRateLimiter(RateLimiter):
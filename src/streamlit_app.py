@@ -39,6 +39,18 @@ def log_error(error: Exception, context: dict = None):
     """Log error"""
     logger.error(f"{type(error).__name__}: {str(error)}", context=context)
 
+# Parsed AI output is a pure function of the text; cache it across reruns
+# and sessions (cache_data hands back copies, so callers may mutate them)
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def parse_calendar_cached(calendar_text: str) -> dict:
+    """Parse calendar output, memoized on the text"""
+    return ContentCalendarParser().parse_calendar_output(calendar_text)
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def parse_strategies_cached(strategies_text: str) -> list:
+    """Parse strategies output, memoized on the text"""
+    return parse_strategies_output(strategies_text)
+
 # ================================
 # CONFIGURE API WITH SECURITY
 # ================================
@@ -1045,9 +1057,8 @@ IMPORTANT: Distribute content across ALL active channels with primary channels r
 
                 # Parse real AI content with error handling
                 try:
-                    parser = ContentCalendarParser()
-                    parsed_calendar = parser.parse_calendar_output(calendar_output)
-                    parsed_strategies = parse_strategies_output(st.session_state.strategies_output)
+                    parsed_calendar = parse_calendar_cached(calendar_output)
+                    parsed_strategies = parse_strategies_cached(st.session_state.strategies_output)
 
                     # Use real content pieces
                     real_content_pieces = parsed_calendar.get('content_pieces', [])
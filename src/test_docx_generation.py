@@ -107,7 +107,7 @@ def run_test_workflow():
     strategies_result = phase1_crew.kickoff()
 
     # Save Phase 1 outputs
-    brand_analysis_output = analyze_brand.output.raw if hasattr(analyze_brand.output, 'raw') else str(analyze_brand.output)
+    brand_analysis_output = analyze_brand.output.raw
     strategies_output = str(strategies_result)
 
     print(f"\n✅ Phase 1 Complete! Auto-selecting Strategy {SELECTED_STRATEGY}...\n")
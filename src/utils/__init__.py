@@ -1,3 +1,4 @@
 """Utilities package for AI Content Strategist"""
 # Intentionally empty to avoid circular imports
-# Import directly from submodules instead: from src.utils.secure_logger import logger
+# Import directly from submodules instead: from utils.secure_logger import logger
+# (always via the src-relative name, never src.utils, so modules load only once)